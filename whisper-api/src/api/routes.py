@@ -1,47 +1,118 @@
 """API route definitions."""
+import sys
 import time
-import json
+import asyncio
 import logging
-from typing import Optional, List
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional, List, Tuple, Union
 
+import orjson
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from .schemas import (
     TranscribeResponse,
     TranscriptionResult,
     HealthResponse,
     StatusResponse,
+    ServerInfo,
+    ModelInfo,
+    StatsInfo,
     ErrorDetail,
     BatchMetadata,
     BatchResult,
+    BatchResultsPayload,
     BatchTranscribeResponse,
 )
 from ..services.whisper import WhisperService
-from ..services.audio import is_supported_format, validate_audio_file
+from ..services.transcription_queue import TranscriptionQueue, PRIORITY_BATCH
+from ..services.transcription_cache import CacheKey, TranscriptionCache
+from ..services.audio import (
+    AudioDurationProbe,
+    get_extension,
+    is_supported_extension,
+    validate_audio_file,
+)
 from ..core.config import Config
-from ..utils.file import save_upload_file, cleanup_temp_file
+from ..utils.file import (
+    save_upload_file,
+    cleanup_temp_file,
+    FileTooLargeError,
+    SavedUpload,
+)
 
 logger = logging.getLogger(__name__)
 
 # Router for transcription endpoints
 router = APIRouter()
 
+# Constant for the lifetime of the process
+PYTHON_VERSION = sys.version.split()[0]
+
 # These will be set by main.py
 whisper_service: Optional[WhisperService] = None
 config: Optional[Config] = None
 start_time: Optional[float] = None
+transcription_queue: Optional[TranscriptionQueue] = None
+transcription_cache: Optional[TranscriptionCache] = None
+
+# A saved and validated batch item:
+# (metadata, saved_upload, prep_seconds, cached (text, confidence) or None)
+PreparedBatchItem = Tuple[BatchMetadata, SavedUpload, float, Optional[Tuple[str, float]]]
+
+# /health and /status snapshots are reused for this long, so frequent
+# orchestrator probes do not rebuild them on every call
+SNAPSHOT_TTL_SECONDS = 0.25
+_health_snapshot: Optional[Tuple[float, HealthResponse]] = None
+_status_snapshot: Optional[Tuple[float, StatusResponse]] = None
 
 
 def init_router(
     service: WhisperService,
     app_config: Config,
     app_start_time: float,
+    queue: TranscriptionQueue,
+    cache: TranscriptionCache,
 ) -> None:
     """Initialize the router with dependencies."""
-    global whisper_service, config, start_time
+    global whisper_service, config, start_time, transcription_queue, transcription_cache
     whisper_service = service
     config = app_config
     start_time = app_start_time
+    transcription_queue = queue
+    transcription_cache = cache
+
+
+async def _validate_upload(
+    saved: SavedUpload,
+    probe: AudioDurationProbe,
+) -> Tuple[bool, Optional[str], Optional[dict]]:
+    """
+    Validate a saved upload.
+
+    Uses the size and duration captured while streaming when available, so
+    the file is not reopened; otherwise runs ffprobe in a worker thread.
+    """
+    kwargs = dict(
+        min_duration_ms=config.server.min_audio_duration_ms,
+        max_duration_seconds=config.server.max_audio_duration_seconds,
+        max_file_size_mb=config.server.max_file_size_mb,
+        file_size_bytes=saved.size_bytes,
+    )
+    duration = probe.duration(saved.size_bytes)
+    if duration is not None:
+        return validate_audio_file(saved.path, duration=duration, **kwargs)
+    # The probe saw the same head/tail bytes, so skip straight to PyAV/ffprobe
+    return await asyncio.to_thread(
+        validate_audio_file, saved.path, parse_header=False, **kwargs
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_hotwords(hotwords: str) -> Tuple[str, ...]:
+    """Parse a comma-separated hotwords string (memoized per distinct string)."""
+    return tuple(w.strip() for w in hotwords.split(",") if w.strip())
 
 
 @router.post("/transcribe", response_model=TranscribeResponse)
@@ -71,7 +142,12 @@ async def transcribe(
     Returns:
         Transcription result
     """
-    if whisper_service is None or config is None:
+    if (
+        whisper_service is None
+        or config is None
+        or transcription_queue is None
+        or transcription_cache is None
+    ):
         raise HTTPException(503, detail="Service not initialized")
 
     if not whisper_service.is_ready():
@@ -83,10 +159,11 @@ async def transcribe(
             ),
         )
 
-    request_start = time.time()
+    request_start = time.perf_counter()
 
     # Validate file format
-    if not is_supported_format(audio_file.filename or ""):
+    ext = get_extension(audio_file.filename or "")
+    if not is_supported_extension(ext):
         return TranscribeResponse(
             success=False,
             error=ErrorDetail(
@@ -96,74 +173,76 @@ async def transcribe(
             ),
         )
 
-    # Read file content
-    content = await audio_file.read()
-    file_size_mb = len(content) / (1024 * 1024)
-
-    # Check file size
-    if file_size_mb > config.server.max_file_size_mb:
+    # Stream to temporary file (aborts early if the size limit is exceeded)
+    probe = AudioDurationProbe()
+    try:
+        saved = await save_upload_file(
+            audio_file,
+            config.server.temp_dir,
+            max_bytes=config.server.max_file_size_mb * 1024 * 1024,
+            suffix=ext,
+            on_chunk=probe.feed,
+        )
+    except FileTooLargeError:
+        # The upload was aborted at the limit, so its full size is unknown
         return TranscribeResponse(
             success=False,
             error=ErrorDetail(
                 code="FILE_TOO_LARGE",
-                message=f"File too large: {file_size_mb:.2f}MB (max: {config.server.max_file_size_mb}MB)",
-                details={
-                    "size_mb": round(file_size_mb, 2),
-                    "max_size_mb": config.server.max_file_size_mb,
-                },
+                message=f"File exceeds {config.server.max_file_size_mb}MB",
+                details={"max_size_mb": config.server.max_file_size_mb},
             ),
         )
 
-    # Save to temporary file
-    tmp_path = await save_upload_file(
-        content,
-        audio_file.filename or "audio.ogg",
-        config.server.temp_dir,
-    )
+    tmp_path = saved.path
 
     try:
-        # Validate audio file
-        is_valid, error_code, error_details = validate_audio_file(
-            tmp_path,
-            min_duration_ms=config.server.min_audio_duration_ms,
-            max_duration_seconds=config.server.max_audio_duration_seconds,
-            max_file_size_mb=config.server.max_file_size_mb,
+        # Parse hotwords from comma-separated string
+        hotwords_list = _parse_hotwords(hotwords) if hotwords else None
+
+        # Identical audio with identical options was already validated and transcribed
+        cache_key = TranscriptionCache.make_key(
+            saved.content_hash, language, filter_aizuchi, hotwords_list
         )
+        cached = transcription_cache.get(cache_key)
 
-        if not is_valid:
-            return TranscribeResponse(
-                success=False,
-                error=ErrorDetail(
-                    code=error_code or "VALIDATION_FAILED",
-                    message=f"Audio validation failed: {error_code}",
-                    details=error_details,
-                ),
-            )
+        if cached is not None:
+            text, confidence = cached
+        else:
+            # Validate audio file
+            is_valid, error_code, error_details = await _validate_upload(saved, probe)
 
-        # Parse hotwords from comma-separated string
-        hotwords_list = None
-        if hotwords:
-            hotwords_list = [w.strip() for w in hotwords.split(",") if w.strip()]
-        
-        # Perform transcription
-        text, confidence, processing_time = whisper_service.transcribe(
-            tmp_path,
-            language=language,
-            filter_aizuchi=filter_aizuchi,
-            additional_hotwords=hotwords_list,
-        )
+            if not is_valid:
+                return TranscribeResponse(
+                    success=False,
+                    error=ErrorDetail(
+                        code=error_code or "VALIDATION_FAILED",
+                        message=f"Audio validation failed: {error_code}",
+                        details=error_details,
+                    ),
+                )
 
-        total_time_ms = int((time.time() - request_start) * 1000)
+            # Perform transcription
+            text, confidence, _ = await transcription_queue.submit(
+                tmp_path,
+                language=language,
+                filter_aizuchi=filter_aizuchi,
+                additional_hotwords=hotwords_list,
+            )
+            transcription_cache.put(cache_key, text, confidence)
+
+        total_time_ms = int((time.perf_counter() - request_start) * 1000)
 
         logger.info(
             f"Transcription complete: user={username}, "
             f"text_len={len(text)}, confidence={confidence:.2f}, "
-            f"time={total_time_ms}ms"
+            f"time={total_time_ms}ms, cached={cached is not None}"
         )
 
-        return TranscribeResponse(
+        # Built from validated inputs; skip re-validation
+        return TranscribeResponse.model_construct(
             success=True,
-            data=TranscriptionResult(
+            data=TranscriptionResult.model_construct(
                 user_id=user_id,
                 username=username,
                 display_name=display_name,
@@ -174,6 +253,7 @@ async def transcribe(
                 language=language,
                 confidence=round(confidence, 3),
                 processing_time_ms=total_time_ms,
+                cached=cached is not None,
             ),
         )
 
@@ -189,7 +269,7 @@ async def transcribe(
 
     finally:
         # Clean up temporary file
-        cleanup_temp_file(tmp_path)
+        await cleanup_temp_file(tmp_path)
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -200,14 +280,21 @@ async def health() -> HealthResponse:
     Returns:
         Health status including model state and statistics
     """
+    global _health_snapshot
+
     if whisper_service is None or config is None:
         raise HTTPException(503, detail="Service not initialized")
 
+    now = time.monotonic()
+    if _health_snapshot is not None and now - _health_snapshot[0] < SNAPSHOT_TTL_SECONDS:
+        return _health_snapshot[1]
+
     uptime = int(time.time() - start_time) if start_time else 0
+    ready = whisper_service.is_ready()
 
-    return HealthResponse(
-        status="healthy" if whisper_service.is_ready() else "loading",
-        model_loaded=whisper_service.is_ready(),
+    response = HealthResponse(
+        status="healthy" if ready else "loading",
+        model_loaded=ready,
         model_name=config.whisper.model_name,
         device=whisper_service.device,
         compute_type=whisper_service.compute_type,
@@ -215,6 +302,8 @@ async def health() -> HealthResponse:
         requests_processed=whisper_service.stats.total_requests,
         avg_processing_time_ms=round(whisper_service.stats.avg_processing_time * 1000, 2),
     )
+    _health_snapshot = (now, response)
+    return response
 
 
 @router.get("/status", response_model=StatusResponse)
@@ -225,52 +314,75 @@ async def status() -> StatusResponse:
     Returns:
         Detailed status including server, model, and statistics
     """
+    global _status_snapshot
+
     if whisper_service is None or config is None:
         raise HTTPException(503, detail="Service not initialized")
 
-    import sys
+    now = time.monotonic()
+    if _status_snapshot is not None and now - _status_snapshot[0] < SNAPSHOT_TTL_SECONDS:
+        return _status_snapshot[1]
 
     uptime = int(time.time() - start_time) if start_time else 0
     hours, remainder = divmod(uptime, 3600)
     minutes, seconds = divmod(remainder, 60)
     uptime_str = f"{hours}:{minutes:02d}:{seconds:02d}"
 
-    service_status = whisper_service.get_status()
-
-    return StatusResponse(
-        server={
-            "version": "1.0.0",
-            "uptime": uptime_str,
-            "uptime_seconds": uptime,
-            "python_version": sys.version.split()[0],
-        },
-        model={
-            "name": config.whisper.model_name,
-            "loaded": whisper_service.is_ready(),
-            "device": whisper_service.device,
-            "compute_type": whisper_service.compute_type,
-            "load_time_seconds": whisper_service.load_time,
-        },
-        stats=service_status["stats"],
+    stats = whisper_service.stats
+
+    response = StatusResponse.model_construct(
+        server=ServerInfo.model_construct(
+            version="1.0.0",
+            uptime=uptime_str,
+            uptime_seconds=uptime,
+            python_version=PYTHON_VERSION,
+        ),
+        model=ModelInfo.model_construct(
+            name=config.whisper.model_name,
+            loaded=whisper_service.is_ready(),
+            device=whisper_service.device,
+            compute_type=whisper_service.compute_type,
+            load_time_seconds=whisper_service.load_time,
+        ),
+        stats=StatsInfo.model_construct(
+            total_requests=stats.total_requests,
+            successful_requests=stats.successful_requests,
+            failed_requests=stats.failed_requests,
+            avg_processing_time_ms=stats.avg_processing_time * 1000,
+            success_rate=stats.success_rate,
+            total_audio_processed_seconds=stats.total_audio_seconds,
+        ),
     )
+    _status_snapshot = (now, response)
+    return response
 
 
 @router.post("/transcribe/batch", response_model=BatchTranscribeResponse)
 async def transcribe_batch(
     files: List[UploadFile] = File(...),
     metadata: str = Form(...),
-) -> BatchTranscribeResponse:
+    stream: bool = Form(False),
+) -> Union[BatchTranscribeResponse, StreamingResponse]:
     """
     Transcribe multiple audio files in batch.
 
     Args:
         files: List of audio files to transcribe
         metadata: JSON string containing metadata for each file
+        stream: Stream results as NDJSON (application/x-ndjson) instead of
+            returning one JSON body. Each line is a BatchResult emitted as
+            soon as it completes (in completion order, see ``index``),
+            followed by a final line with the summary counts.
 
     Returns:
         Batch transcription results
     """
-    if whisper_service is None or config is None:
+    if (
+        whisper_service is None
+        or config is None
+        or transcription_queue is None
+        or transcription_cache is None
+    ):
         raise HTTPException(503, detail="Service not initialized")
 
     if not whisper_service.is_ready():
@@ -282,12 +394,12 @@ async def transcribe_batch(
             ),
         )
 
-    batch_start = time.time()
+    batch_start = time.perf_counter()
 
     # Parse metadata JSON
     try:
-        metadata_list: List[dict] = json.loads(metadata)
-    except json.JSONDecodeError as e:
+        metadata_list: List[dict] = orjson.loads(metadata)
+    except orjson.JSONDecodeError as e:
         return BatchTranscribeResponse(
             success=False,
             error=ErrorDetail(
@@ -310,31 +422,44 @@ async def transcribe_batch(
             ),
         )
 
-    results: List[BatchResult] = []
     tmp_paths: List[str] = []
+    # Identical audio within one batch is transcribed once and shared
+    inflight: Dict[CacheKey, asyncio.Future] = {}
+    semaphore = asyncio.Semaphore(
+        max(1, min(config.server.batch_prep_concurrency, len(files)))
+    )
 
-    try:
-        # Process each file
-        for index, (file, meta) in enumerate(zip(files, metadata_list)):
-            file_start = time.time()
+    async def prepare(
+        index: int,
+        file: UploadFile,
+        meta: dict,
+    ) -> Union[BatchResult, PreparedBatchItem]:
+        """
+        Parse metadata, save and validate a single batch item.
+
+        Returns:
+            A failed BatchResult, or a PreparedBatchItem
+        """
+        async with semaphore:
+            prep_start = time.perf_counter()
 
             try:
                 # Parse metadata
                 batch_meta = BatchMetadata(**meta)
             except Exception as e:
-                results.append(BatchResult(
+                return BatchResult(
                     index=index,
                     success=False,
                     error=ErrorDetail(
                         code="INVALID_METADATA_ENTRY",
                         message=f"Invalid metadata at index {index}: {str(e)}",
                     ),
-                ))
-                continue
+                )
 
             # Validate file format
-            if not is_supported_format(file.filename or ""):
-                results.append(BatchResult(
+            ext = get_extension(file.filename or "")
+            if not is_supported_extension(ext):
+                return BatchResult(
                     index=index,
                     success=False,
                     error=ErrorDetail(
@@ -342,98 +467,203 @@ async def transcribe_batch(
                         message="Unsupported audio format",
                         details={"filename": file.filename},
                     ),
-                ))
-                continue
-
-            # Read and save file
-            content = await file.read()
-            file_size_mb = len(content) / (1024 * 1024)
+                )
 
-            if file_size_mb > config.server.max_file_size_mb:
-                results.append(BatchResult(
+            # Stream file to disk
+            probe = AudioDurationProbe()
+            try:
+                saved = await save_upload_file(
+                    file,
+                    config.server.temp_dir,
+                    max_bytes=config.server.max_file_size_mb * 1024 * 1024,
+                    suffix=ext,
+                    on_chunk=probe.feed,
+                )
+            except FileTooLargeError:
+                return BatchResult(
                     index=index,
                     success=False,
                     error=ErrorDetail(
                         code="FILE_TOO_LARGE",
-                        message=f"File too large: {file_size_mb:.2f}MB",
-                        details={"size_mb": round(file_size_mb, 2)},
+                        message=f"File exceeds {config.server.max_file_size_mb}MB",
+                        details={"max_size_mb": config.server.max_file_size_mb},
                     ),
-                ))
-                continue
+                )
+            tmp_paths.append(saved.path)
 
-            tmp_path = await save_upload_file(
-                content,
-                file.filename or "audio.ogg",
-                config.server.temp_dir,
-            )
-            tmp_paths.append(tmp_path)
+            # Cached results were validated when first transcribed. The hit is
+            # carried along so a later eviction cannot send unvalidated audio
+            # to the queue.
+            cache_key = TranscriptionCache.make_key(saved.content_hash, batch_meta.language)
+            cached = transcription_cache.get(cache_key)
+            if cached is not None:
+                return batch_meta, saved, time.perf_counter() - prep_start, cached
 
             try:
                 # Validate audio
-                is_valid, error_code, error_details = validate_audio_file(
-                    tmp_path,
-                    min_duration_ms=config.server.min_audio_duration_ms,
-                    max_duration_seconds=config.server.max_audio_duration_seconds,
-                    max_file_size_mb=config.server.max_file_size_mb,
-                )
-
-                if not is_valid:
-                    results.append(BatchResult(
-                        index=index,
-                        success=False,
-                        error=ErrorDetail(
-                            code=error_code or "VALIDATION_FAILED",
-                            message=f"Audio validation failed: {error_code}",
-                            details=error_details,
-                        ),
-                    ))
-                    continue
-
-                # Perform transcription
-                text, confidence, _ = whisper_service.transcribe(
-                    tmp_path,
-                    language=batch_meta.language,
-                )
-
-                processing_time_ms = int((time.time() - file_start) * 1000)
-
-                results.append(BatchResult(
-                    index=index,
-                    success=True,
-                    text=text,
-                    user_id=batch_meta.user_id,
-                    username=batch_meta.username,
-                    display_name=batch_meta.display_name,
-                    start_ts=batch_meta.start_ts,
-                    end_ts=batch_meta.end_ts,
-                    duration_ms=batch_meta.end_ts - batch_meta.start_ts,
-                    language=batch_meta.language,
-                    confidence=round(confidence, 3),
-                    processing_time_ms=processing_time_ms,
-                ))
-
-                logger.info(
-                    f"Batch item {index} complete: user={batch_meta.username}, "
-                    f"text_len={len(text)}, time={processing_time_ms}ms"
-                )
-
+                is_valid, error_code, error_details = await _validate_upload(saved, probe)
             except Exception as e:
                 logger.error(f"Batch item {index} error: {e}")
-                results.append(BatchResult(
+                return BatchResult(
                     index=index,
                     success=False,
                     error=ErrorDetail(
                         code="TRANSCRIPTION_FAILED",
                         message=str(e),
                     ),
-                ))
+                )
+
+            if not is_valid:
+                return BatchResult(
+                    index=index,
+                    success=False,
+                    error=ErrorDetail(
+                        code=error_code or "VALIDATION_FAILED",
+                        message=f"Audio validation failed: {error_code}",
+                        details=error_details,
+                    ),
+                )
+
+            return batch_meta, saved, time.perf_counter() - prep_start, None
+
+    async def transcribe_prepared(
+        index: int,
+        item: Union[BatchResult, PreparedBatchItem],
+    ) -> BatchResult:
+        """Transcribe a prepared batch item via the inference queue."""
+        if isinstance(item, BatchResult):
+            return item
+
+        batch_meta, saved, prep_seconds, cached = item
+        cache_key = TranscriptionCache.make_key(saved.content_hash, batch_meta.language)
+
+        try:
+            if cached is not None:
+                # Only save/lookup time is reported; flagged via ``cached``
+                text, confidence = cached
+                processing_time = 0.0
+            else:
+                # Perform transcription
+                submitted = inflight.get(cache_key)
+                if submitted is None:
+                    submitted = inflight[cache_key] = asyncio.ensure_future(
+                        transcription_queue.submit(
+                            saved.path,
+                            language=batch_meta.language,
+                            priority=PRIORITY_BATCH,
+                        )
+                    )
+                # Shielded so one cancelled item does not fail its duplicates
+                text, confidence, processing_time = await asyncio.shield(submitted)
+                transcription_cache.put(cache_key, text, confidence)
+        except Exception as e:
+            logger.error(f"Batch item {index} error: {e}")
+            return BatchResult(
+                index=index,
+                success=False,
+                error=ErrorDetail(
+                    code="TRANSCRIPTION_FAILED",
+                    message=str(e),
+                ),
+            )
+
+        processing_time_ms = int((prep_seconds + processing_time) * 1000)
+
+        logger.info(
+            f"Batch item {index} complete: user={batch_meta.username}, "
+            f"text_len={len(text)}, time={processing_time_ms}ms"
+        )
+
+        # Built from validated metadata; skip re-validation
+        return BatchResult.model_construct(
+            index=index,
+            success=True,
+            text=text,
+            user_id=batch_meta.user_id,
+            username=batch_meta.username,
+            display_name=batch_meta.display_name,
+            start_ts=batch_meta.start_ts,
+            end_ts=batch_meta.end_ts,
+            duration_ms=batch_meta.end_ts - batch_meta.start_ts,
+            language=batch_meta.language,
+            confidence=round(confidence, 3),
+            processing_time_ms=processing_time_ms,
+            cached=cached is not None,
+        )
+
+    stream_tasks: List[asyncio.Future] = []
+
+    async def cleanup_batch() -> None:
+        """Cancel outstanding work and remove the temp files (idempotent)."""
+        pending = [*stream_tasks, *inflight.values()]
+        for task in pending:
+            task.cancel()
+        # Cancelled submits return once the worker thread is done with the file
+        await asyncio.gather(*pending, return_exceptions=True)
+        paths = tmp_paths[:]
+        tmp_paths.clear()
+        await asyncio.gather(*(cleanup_temp_file(p) for p in paths))
+
+    async def stream_results(
+        prepared: List[Union[BatchResult, PreparedBatchItem]],
+    ) -> AsyncIterator[bytes]:
+        """Yield each result as an NDJSON line as soon as it completes."""
+        stream_tasks.extend(
+            asyncio.ensure_future(transcribe_prepared(index, item))
+            for index, item in enumerate(prepared)
+        )
+        successful_count = 0
+        try:
+            for next_result in asyncio.as_completed(stream_tasks):
+                result = await next_result
+                successful_count += result.success
+                yield orjson.dumps(result.model_dump()) + b"\n"
+
+            total_time_ms = int((time.perf_counter() - batch_start) * 1000)
+            logger.info(
+                f"Batch complete: {successful_count}/{len(files)} successful, "
+                f"total_time={total_time_ms}ms"
+            )
+            yield orjson.dumps({
+                "total_count": len(files),
+                "successful_count": successful_count,
+                "failed_count": len(files) - successful_count,
+                "total_processing_time_ms": total_time_ms,
+            }) + b"\n"
+        finally:
+            # Stop remaining work as soon as the client goes away mid-stream
+            await cleanup_batch()
+
+    streaming = False
+    try:
+        # Save and validate all items concurrently (I/O bound)
+        prepared = await asyncio.gather(*(
+            prepare(index, file, meta)
+            for index, (file, meta) in enumerate(zip(files, metadata_list))
+        ))
+
+        if stream:
+            # The response takes over temp file cleanup; the background task
+            # also runs when the body is never iterated (early disconnect)
+            streaming = True
+            return StreamingResponse(
+                stream_results(prepared),
+                media_type="application/x-ndjson",
+                background=BackgroundTask(cleanup_batch),
+            )
+
+        # Queue all items at once so the inference worker can batch them
+        results: List[BatchResult] = await asyncio.gather(*(
+            transcribe_prepared(index, item)
+            for index, item in enumerate(prepared)
+        ))
 
     finally:
         # Clean up all temporary files
-        for tmp_path in tmp_paths:
-            cleanup_temp_file(tmp_path)
+        if not streaming:
+            await cleanup_batch()
 
-    total_time_ms = int((time.time() - batch_start) * 1000)
+    total_time_ms = int((time.perf_counter() - batch_start) * 1000)
     successful_count = sum(1 for r in results if r.success)
 
     logger.info(
@@ -441,14 +671,13 @@ async def transcribe_batch(
         f"total_time={total_time_ms}ms"
     )
 
-    return BatchTranscribeResponse(
+    return BatchTranscribeResponse.model_construct(
         success=True,
-        data={
-            "results": [r.model_dump() for r in results],
-            "total_count": len(files),
-            "successful_count": successful_count,
-            "failed_count": len(files) - successful_count,
-            "total_processing_time_ms": total_time_ms,
-        },
+        data=BatchResultsPayload.model_construct(
+            results=results,
+            total_count=len(files),
+            successful_count=successful_count,
+            failed_count=len(files) - successful_count,
+            total_processing_time_ms=total_time_ms,
+        ),
     )
-
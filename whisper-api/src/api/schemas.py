@@ -1,6 +1,12 @@
 """Pydantic schemas for API requests and responses."""
+import sys
 from typing import Optional, List, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string so repeated values share one object."""
+    return sys.intern(value) if value is not None else None
 
 
 # =============================================================================
@@ -34,6 +40,10 @@ class BatchMetadata(BaseModel):
     end_ts: int
     language: str = "ja"
 
+    # Batches usually repeat the same few speakers and languages; interning
+    # lets every result for a speaker reference one string object.
+    _intern_strings = field_validator("username", "display_name", "language")(_intern)
+
 
 # =============================================================================
 # Response Schemas
@@ -53,6 +63,7 @@ class TranscriptionResult(BaseModel):
     language: str
     confidence: float
     processing_time_ms: int
+    cached: bool = False  # Served from the transcription cache
 
 
 class ErrorDetail(BaseModel):
@@ -86,14 +97,25 @@ class BatchResult(BaseModel):
     language: Optional[str] = None
     confidence: Optional[float] = None
     processing_time_ms: Optional[int] = None
+    cached: bool = False  # Served from the transcription cache
     error: Optional[ErrorDetail] = None
 
 
+class BatchResultsPayload(BaseModel):
+    """Results and summary counts for a batch transcription."""
+
+    results: List[BatchResult]
+    total_count: int
+    successful_count: int
+    failed_count: int
+    total_processing_time_ms: int
+
+
 class BatchTranscribeResponse(BaseModel):
     """Response for batch transcription endpoint."""
 
     success: bool
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[BatchResultsPayload] = None
     error: Optional[ErrorDetail] = None
 
 
@@ -110,10 +132,40 @@ class HealthResponse(BaseModel):
     avg_processing_time_ms: float
 
 
+class ServerInfo(BaseModel):
+    """Server section of the status response."""
+
+    version: str
+    uptime: str
+    uptime_seconds: int
+    python_version: str
+
+
+class ModelInfo(BaseModel):
+    """Model section of the status response."""
+
+    name: str
+    loaded: bool
+    device: str
+    compute_type: str
+    load_time_seconds: Optional[float] = None
+
+
+class StatsInfo(BaseModel):
+    """Statistics section of the status response."""
+
+    total_requests: int
+    successful_requests: int
+    failed_requests: int
+    avg_processing_time_ms: float
+    success_rate: float
+    total_audio_processed_seconds: float
+
+
 class StatusResponse(BaseModel):
     """Response for status endpoint."""
 
-    server: Dict[str, Any]
-    model: Dict[str, Any]
-    stats: Dict[str, Any]
+    server: ServerInfo
+    model: ModelInfo
+    stats: StatsInfo
 
@@ -24,6 +24,7 @@ class WhisperConfig(BaseSettings):
     # Cloud provider model settings
     groq_model: str = "whisper-large-v3"  # or "whisper-large-v3-turbo"
     openai_model: str = "whisper-1"
+    cloud_max_concurrency: int = 8  # Parallel API requests per batch
 
     # Inference parameters
     beam_size: int = 5
@@ -64,9 +65,20 @@ class ServerConfig(BaseSettings):
     min_audio_duration_ms: int = 500
     request_timeout_seconds: int = 120
 
+    # Batch processing
+    batch_prep_concurrency: int = 8  # Max batch items saved/validated concurrently
+
+    # Inference queue (coalesces concurrent requests)
+    inference_max_batch_size: int = 8
+    inference_batch_window_ms: int = 5  # Cloud providers only; local mode never waits
+
+    # Transcription result cache (keyed by audio content hash, 0 = disabled)
+    transcription_cache_size: int = 512
+
     # Temporary files
     temp_dir: str = "./temp"
     cleanup_interval_seconds: int = 300
+    temp_file_max_age_seconds: int = 3600  # 1 hour
 
     model_config = {"env_prefix": "SERVER_"}
 
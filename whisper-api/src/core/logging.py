@@ -1,17 +1,22 @@
 """Logging configuration."""
 import logging
 import sys
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+
 
 class JsonFormatter(logging.Formatter):
     """JSON log formatter."""
 
+    # Serialize naive/UTC datetimes as "...Z" in C instead of isoformat() + "Z"
+    _DUMPS_OPTIONS = orjson.OPT_UTC_Z
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # record.created is captured by logging itself; no second clock read
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -20,10 +25,11 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        if hasattr(record, "extra"):
-            log_data.update(record.extra)
+        extra = record.__dict__.get("extra")
+        if extra:
+            log_data.update(extra)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return orjson.dumps(log_data, option=self._DUMPS_OPTIONS).decode()
 
 
 class TextFormatter(logging.Formatter):
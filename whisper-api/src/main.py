@@ -10,6 +10,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from .core.config import get_config
 from .core.logging import setup_logging
 from .services.whisper import WhisperService
+from .services.transcription_queue import TranscriptionQueue
+from .services.transcription_cache import TranscriptionCache
 from .api import routes
 from .utils.file import ensure_directories, periodic_cleanup
 
@@ -57,11 +59,21 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to load Whisper model: {e}")
         raise
 
+    # Start inference queue worker
+    transcription_queue = TranscriptionQueue(
+        whisper_service,
+        max_batch_size=config.server.inference_max_batch_size,
+        batch_window_ms=config.server.inference_batch_window_ms,
+    )
+    queue_task = transcription_queue.start()
+
     # Initialize routes with dependencies
     routes.init_router(
         service=whisper_service,
         app_config=config,
         app_start_time=app.state.start_time,
+        queue=transcription_queue,
+        cache=TranscriptionCache(config.server.transcription_cache_size),
     )
 
     # Start background cleanup task
@@ -69,7 +81,7 @@ async def lifespan(app: FastAPI):
         periodic_cleanup(
             temp_dir=config.server.temp_dir,
             interval_seconds=config.server.cleanup_interval_seconds,
-            max_age_seconds=3600,  # 1 hour
+            max_age_seconds=config.server.temp_file_max_age_seconds,
         )
     )
 
@@ -84,12 +96,15 @@ async def lifespan(app: FastAPI):
     # ==========================================================================
     logger.info("Shutting down Whisper API Server...")
 
-    # Cancel cleanup task
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
+    # Cancel background tasks
+    for task in (cleanup_task, queue_task):
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    whisper_service.close()
 
     logger.info("Server shutdown complete")
 
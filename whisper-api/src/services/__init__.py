@@ -1,18 +1,26 @@
 """Services module."""
 
-from .whisper import WhisperService, TranscriptionStats
+from .whisper import WhisperService, TranscriptionStats, TranscriptionRequest
+from .transcription_queue import TranscriptionQueue
+from .transcription_cache import TranscriptionCache
 from .aizuchi_filter import AizuchiFilter
 from .hotwords import HotwordsManager
-from .audio import is_supported_format, validate_audio_file
+from .audio import AudioDurationProbe, is_supported_format, is_supported_extension, get_extension, validate_audio_file
 from .device import resolve_device_and_compute_type
 from .cloud_providers import GroqProvider, OpenAIProvider, create_provider
 
 __all__ = [
     "WhisperService",
     "TranscriptionStats",
+    "TranscriptionRequest",
+    "TranscriptionQueue",
+    "TranscriptionCache",
     "AizuchiFilter",
     "HotwordsManager",
+    "AudioDurationProbe",
     "is_supported_format",
+    "is_supported_extension",
+    "get_extension",
     "validate_audio_file",
     "resolve_device_and_compute_type",
     "GroqProvider",
@@ -1,10 +1,16 @@
 """相槌フィルター - Aizuchi (filler word) filter for Japanese transcription."""
 import re
-from typing import List, Tuple, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
 
+from ..utils.patterns import compile_alternation, fullmatch_body, leading_chars
+from ..utils.text import NormalizedText, normalize_text
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized is_aizuchi decisions per filter
+DECISION_CACHE_SIZE = 4096
+
 
 class AizuchiFilter:
     """
@@ -69,16 +75,48 @@ class AizuchiFilter:
             max_length: Maximum text length to consider as aizuchi.
             enabled: Whether the filter is enabled.
         """
-        self.patterns = patterns or self.DEFAULT_PATTERNS
+        self.patterns = list(patterns or self.DEFAULT_PATTERNS)
         self.max_length = max_length
         self.enabled = enabled
-        self._compiled = [re.compile(p) for p in self.patterns]
+        self._rebuild_combined()
         
         logger.debug(
             f"AizuchiFilter initialized: enabled={enabled}, "
-            f"patterns={len(self._compiled)}, max_length={max_length}"
+            f"patterns={len(self.patterns)}, max_length={max_length}"
         )
 
+    def _rebuild_combined(self) -> None:
+        """
+        Fuse all patterns into one alternation so a check is a single match.
+
+        Patterns are rewritten for ``fullmatch`` (``^...$`` anchors dropped)
+        and each is wrapped in a non-capturing group, so the combined pattern
+        matches exactly when one of the originals would. RE2 is used when
+        available. Memoized decisions are discarded since
+        they may no longer hold.
+
+        When every pattern starts with a predictable character, patterns are
+        also grouped by first character so text starting with anything else
+        is rejected without running a regex.
+        """
+        # Input is always stripped, so a trailing $ never sees a newline
+        bodies = {pattern: fullmatch_body(pattern) for pattern in self.patterns}
+        self._combined = compile_alternation(bodies.values())
+        self._by_first: Optional[Dict[str, object]] = None
+
+        grouped: Dict[str, List[str]] = {}
+        for pattern in self.patterns:
+            chars = leading_chars(pattern)
+            if chars is None:
+                break
+            for char in chars:
+                grouped.setdefault(char, []).append(bodies[pattern])
+        else:
+            self._by_first = {
+                char: compile_alternation(group) for char, group in grouped.items()
+            }
+        self._decisions: Dict[str, bool] = {}
+
     def is_aizuchi(self, text: str) -> bool:
         """
         Check if the text is an aizuchi (filler word).
@@ -93,22 +131,89 @@ class AizuchiFilter:
             return False
 
         t = text.strip()
+        return self._is_aizuchi_stripped(t, len(t))
+
+    def is_aizuchi_norm(self, text: NormalizedText) -> bool:
+        """
+        Check if already-normalized text is an aizuchi.
+        
+        Args:
+            text: Text from normalize_text.
+            
+        Returns:
+            True if the text is an aizuchi and should be filtered.
+        """
+        if not self.enabled:
+            return False
 
+        return self._is_aizuchi_stripped(text.stripped, text.length)
+
+    def _is_aizuchi_stripped(self, t: str, length: int) -> bool:
+        """Check stripped text of the given length against the patterns."""
         # Long text is not aizuchi
-        if len(t) > self.max_length:
+        if length > self.max_length:
             return False
 
         # Empty text is not aizuchi (but should be handled elsewhere)
-        if len(t) == 0:
+        if length == 0:
             return False
 
-        # Check against patterns
-        for pattern in self._compiled:
-            if pattern.match(t):
-                logger.debug(f"Aizuchi detected: '{t}'")
-                return True
+        if self._by_first is not None:
+            matcher = self._by_first.get(t[0])
+            if matcher is None:
+                return False
+        else:
+            matcher = self._combined
 
-        return False
+        # VC transcripts repeat a small vocabulary of short utterances
+        cached = self._decisions.get(t)
+        if cached is not None:
+            return cached
+
+        is_match = matcher.fullmatch(t) is not None
+        if is_match:
+            logger.debug(f"Aizuchi detected: '{t}'")
+
+        if len(self._decisions) >= DECISION_CACHE_SIZE:
+            self._decisions.clear()
+        self._decisions[t] = is_match
+        return is_match
+
+    def aizuchi_mask(self, texts: Sequence[str]) -> List[bool]:
+        """
+        Check many texts at once.
+
+        Each distinct text is checked only once per call, and text that is
+        too long even before stripping is rejected without normalizing it.
+        
+        Args:
+            texts: Texts to check.
+            
+        Returns:
+            List of is_aizuchi results in the same order as texts.
+        """
+        if not self.enabled:
+            return [False] * len(texts)
+
+        is_aizuchi_norm = self.is_aizuchi_norm
+        max_length = self.max_length
+        decisions: Dict[str, bool] = {}
+        mask = []
+        for text in texts:
+            # Most speech is longer than any aizuchi
+            if (
+                len(text) > max_length
+                and not text[:1].isspace()
+                and not text[-1:].isspace()
+            ):
+                mask.append(False)
+                continue
+
+            decision = decisions.get(text)
+            if decision is None:
+                decision = decisions[text] = is_aizuchi_norm(normalize_text(text))
+            mask.append(decision)
+        return mask
 
     def filter_text(self, text: str) -> Optional[str]:
         """
@@ -137,10 +242,14 @@ class AizuchiFilter:
         Returns:
             Filtered list of segments without aizuchi.
         """
+        if not self.enabled:
+            return list(segments)
+
+        mask = self.aizuchi_mask([segment[2] for segment in segments])
         filtered = [
-            (start, end, text)
-            for start, end, text in segments
-            if not self.is_aizuchi(text)
+            segment
+            for segment, is_aizuchi in zip(segments, mask)
+            if not is_aizuchi
         ]
         
         filtered_count = len(segments) - len(filtered)
@@ -151,15 +260,16 @@ class AizuchiFilter:
 
     def add_pattern(self, pattern: str) -> None:
         """Add a new pattern to the filter."""
+        # Validate on its own; wrapped in the alternation, bad syntax could slip through
+        re.compile(pattern)
         self.patterns.append(pattern)
-        self._compiled.append(re.compile(pattern))
+        self._rebuild_combined()
 
     def remove_pattern(self, pattern: str) -> bool:
         """Remove a pattern from the filter. Returns True if found and removed."""
         if pattern in self.patterns:
-            idx = self.patterns.index(pattern)
-            self.patterns.pop(idx)
-            self._compiled.pop(idx)
+            self.patterns.remove(pattern)
+            self._rebuild_combined()
             return True
         return False
 
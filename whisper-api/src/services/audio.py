@@ -1,24 +1,140 @@
 """Audio processing utilities."""
 import os
 import logging
+import subprocess
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-def get_audio_duration(file_path: str) -> Optional[float]:
-    """
-    Get the duration of an audio file in seconds.
+# Bytes kept from the start/end of an upload for inline duration parsing.
+# The tail must hold a full Ogg page (max 65,307 bytes).
+_PROBE_HEAD_BYTES = 64 * 1024
+_PROBE_TAIL_BYTES = 128 * 1024
 
-    Args:
-        file_path: Path to the audio file
 
-    Returns:
-        Duration in seconds, or None if unable to determine
-    """
+def _parse_wav_duration(head: bytes, total_size: int) -> Optional[float]:
+    """Get WAV duration from the RIFF header (fmt byte rate and data size)."""
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None
+
+    byte_rate = 0
+    offset = 12
+    while offset + 8 <= len(head):
+        chunk_id = head[offset:offset + 4]
+        size = int.from_bytes(head[offset + 4:offset + 8], "little")
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if body + 12 > len(head):
+                return None
+            byte_rate = int.from_bytes(head[body + 8:body + 12], "little")
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # Streaming writers leave a placeholder size; trust the real file size
+            return min(size, total_size - body) / byte_rate
+
+        offset = body + size + (size & 1)
+
+    return None
+
+
+def _parse_ogg_duration(head: bytes, tail: bytes) -> Optional[float]:
+    """Get Ogg Opus/Vorbis duration from the last page's granule position."""
+    if len(head) < 28 or head[:4] != b"OggS":
+        return None
+
+    # Identification header is the first packet of the first page
+    packet_start = 27 + head[26]
+    packet = head[packet_start:packet_start + 16]
+    if packet.startswith(b"OpusHead") and len(packet) >= 12:
+        sample_rate = 48000  # Opus granule positions are always 48kHz
+        pre_skip = int.from_bytes(packet[10:12], "little")
+    elif packet.startswith(b"\x01vorbis") and len(packet) >= 16:
+        sample_rate = int.from_bytes(packet[12:16], "little")
+        pre_skip = 0
+    else:
+        return None
+
+    # The last page must end exactly at the end of the file
+    last = tail.rfind(b"OggS")
+    if last < 0 or last + 27 > len(tail) or tail[last + 4] != 0:
+        return None
+    segment_count = tail[last + 26]
+    segments = tail[last + 27:last + 27 + segment_count]
+    if last + 27 + segment_count + sum(segments) != len(tail):
+        return None
+
+    granule = int.from_bytes(tail[last + 6:last + 14], "little", signed=True)
+    if granule < 0 or sample_rate <= 0:
+        return None
+    return max(0, granule - pre_skip) / sample_rate
+
+
+def _parse_flac_duration(head: bytes) -> Optional[float]:
+    """Get FLAC duration from the STREAMINFO block."""
+    # "fLaC", then the STREAMINFO block header (type 0) and its 34-byte body
+    if len(head) < 26 or head[:4] != b"fLaC" or head[4] & 0x7F != 0:
+        return None
+
+    # 20 bits sample rate, 3 bits channels, 5 bits bps, 36 bits total samples
+    packed = int.from_bytes(head[18:26], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None
+    return total_samples / sample_rate
+
+
+def _parse_duration(head: bytes, tail: bytes, total_size: int) -> Optional[float]:
+    """Get duration from the first and last bytes of a WAV, Ogg or FLAC file."""
+    try:
+        magic = head[:4]
+        if magic == b"RIFF":
+            return _parse_wav_duration(head, total_size)
+        if magic == b"OggS":
+            return _parse_ogg_duration(head, tail)
+        if magic == b"fLaC":
+            return _parse_flac_duration(head)
+    except Exception as e:
+        logger.debug(f"Could not parse audio duration from header: {e}")
+    return None
+
+
+def _read_duration_from_header(file_path: str, total_size: int) -> Optional[float]:
+    """Read the start and end of a file and parse its duration from the container."""
+    with open(file_path, "rb") as f:
+        head = f.read(_PROBE_HEAD_BYTES)
+        if total_size > _PROBE_TAIL_BYTES:
+            f.seek(-_PROBE_TAIL_BYTES, os.SEEK_END)
+            tail = f.read()
+        else:
+            f.seek(0)
+            tail = f.read()
+    return _parse_duration(head, tail, total_size)
+
+
+def _probe_with_av(file_path: str) -> Optional[float]:
+    """Get duration in-process with PyAV (installed with faster-whisper)."""
+    try:
+        import av
+    except ImportError:
+        return None
+
     try:
-        import subprocess
+        with av.open(file_path) as container:
+            if container.duration:
+                return container.duration / av.time_base
+    except Exception as e:
+        logger.debug(f"PyAV could not read audio duration: {e}")
+
+    return None
 
+
+def _run_ffprobe(file_path: str) -> Optional[float]:
+    """Get duration by running ffprobe."""
+    try:
         result = subprocess.run(
             [
                 "ffprobe",
@@ -40,39 +156,118 @@ def get_audio_duration(file_path: str) -> Optional[float]:
     return None
 
 
+def get_audio_duration(file_path: str, parse_header: bool = True) -> Optional[float]:
+    """
+    Get the duration of an audio file in seconds.
+
+    WAV, Ogg and FLAC durations are read from the container header; other
+    formats are opened in-process with PyAV, and ffprobe is only spawned
+    when PyAV is unavailable or fails.
+
+    Args:
+        file_path: Path to the audio file
+        parse_header: Try the container header first (pass False when an
+            AudioDurationProbe already failed on the same bytes)
+
+    Returns:
+        Duration in seconds, or None if unable to determine
+    """
+    duration = None
+    if parse_header:
+        try:
+            duration = _read_duration_from_header(file_path, os.path.getsize(file_path))
+        except OSError as e:
+            logger.debug(f"Could not get audio duration: {e}")
+            return None
+
+    if duration is None:
+        duration = _probe_with_av(file_path)
+    if duration is None:
+        duration = _run_ffprobe(file_path)
+    return duration
+
+
+class AudioDurationProbe:
+    """
+    Determine audio duration from an upload while it is being written.
+
+    Feed every chunk to ``feed``; only the first and last few KB are kept.
+    WAV, Ogg (Opus/Vorbis) and FLAC durations can be read from those bytes,
+    which lets validation skip the ffprobe subprocess. Other formats return
+    None and fall back to ffprobe.
+    """
+
+    def __init__(self):
+        self._head = b""
+        self._tail = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Record a chunk of the upload."""
+        if len(self._head) < _PROBE_HEAD_BYTES:
+            self._head += chunk[:_PROBE_HEAD_BYTES - len(self._head)]
+        if len(chunk) >= _PROBE_TAIL_BYTES:
+            self._tail = chunk[-_PROBE_TAIL_BYTES:]
+        else:
+            self._tail = (self._tail + chunk)[-_PROBE_TAIL_BYTES:]
+
+    def duration(self, total_size: int) -> Optional[float]:
+        """
+        Get the duration in seconds.
+
+        Args:
+            total_size: Total number of bytes fed
+
+        Returns:
+            Duration in seconds, or None if it cannot be parsed inline
+        """
+        return _parse_duration(self._head, self._tail, total_size)
+
+
 def validate_audio_file(
     file_path: str,
     min_duration_ms: int = 500,
     max_duration_seconds: int = 300,
     max_file_size_mb: int = 25,
+    file_size_bytes: Optional[int] = None,
+    duration: Optional[float] = None,
+    parse_header: bool = True,
 ) -> Tuple[bool, Optional[str], Optional[dict]]:
     """
     Validate an audio file.
 
+    When both file_size_bytes and duration are already known (e.g. from
+    AudioDurationProbe) the file is not touched at all.
+
     Args:
         file_path: Path to the audio file
         min_duration_ms: Minimum duration in milliseconds
         max_duration_seconds: Maximum duration in seconds
         max_file_size_mb: Maximum file size in megabytes
+        file_size_bytes: Known file size (skips the stat calls)
+        duration: Known duration in seconds (skips ffprobe)
+        parse_header: Passed to get_audio_duration when duration is unknown
 
     Returns:
         Tuple[bool, Optional[str], Optional[dict]]:
             (is_valid, error_code, error_details)
     """
-    # Check file exists
-    if not os.path.exists(file_path):
-        return False, "FILE_NOT_FOUND", {"path": file_path}
+    if file_size_bytes is None:
+        # Check file exists
+        if not os.path.exists(file_path):
+            return False, "FILE_NOT_FOUND", {"path": file_path}
+        file_size_bytes = os.path.getsize(file_path)
 
     # Check file size
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    file_size_mb = file_size_bytes / (1024 * 1024)
     if file_size_mb > max_file_size_mb:
         return False, "FILE_TOO_LARGE", {
             "size_mb": round(file_size_mb, 2),
             "max_size_mb": max_file_size_mb,
         }
 
-    # Check duration (optional, requires ffprobe)
-    duration = get_audio_duration(file_path)
+    # Check duration (optional, requires ffprobe unless already known)
+    if duration is None:
+        duration = get_audio_duration(file_path, parse_header=parse_header)
     if duration is not None:
         duration_ms = duration * 1000
 
@@ -91,17 +286,47 @@ def validate_audio_file(
     return True, None, None
 
 
+SUPPORTED_FORMATS = (
+    ".ogg",
+    ".opus",
+    ".wav",
+    ".mp3",
+    ".m4a",
+    ".flac",
+    ".webm",
+)
+_SUPPORTED_FORMAT_SET = frozenset(SUPPORTED_FORMATS)
+
+
 def get_supported_formats() -> list:
-    """Get list of supported audio formats."""
-    return [
-        ".ogg",
-        ".opus",
-        ".wav",
-        ".mp3",
-        ".m4a",
-        ".flac",
-        ".webm",
-    ]
+    """Get list of supported audio formats (a copy; use is_supported_* to check)."""
+    return list(SUPPORTED_FORMATS)
+
+
+def get_extension(filename: str) -> str:
+    """
+    Get the lowercased extension of a filename.
+
+    Args:
+        filename: Name of the file
+
+    Returns:
+        Extension including the dot (e.g. ".ogg"), or "" if there is none
+    """
+    return os.path.splitext(filename)[1].lower()
+
+
+def is_supported_extension(ext: str) -> bool:
+    """
+    Check if a lowercased file extension is supported.
+
+    Args:
+        ext: Extension including the dot, as returned by get_extension
+
+    Returns:
+        True if format is supported
+    """
+    return ext in _SUPPORTED_FORMAT_SET
 
 
 def is_supported_format(filename: str) -> bool:
@@ -116,6 +341,4 @@ def is_supported_format(filename: str) -> bool:
     """
     if not filename:
         return False
-    ext = os.path.splitext(filename)[1].lower()
-    return ext in get_supported_formats()
-
+    return os.path.splitext(filename)[1].lower() in _SUPPORTED_FORMAT_SET
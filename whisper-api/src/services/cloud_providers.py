@@ -9,6 +9,46 @@ from abc import ABC, abstractmethod
 logger = logging.getLogger(__name__)
 
 
+# Connection pool shared by all requests of one provider
+HTTP_MAX_CONNECTIONS = 32
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 16
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+# Same as the groq/openai SDK defaults: long uploads, quick connect failures
+HTTP_TIMEOUT_SECONDS = 600.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+def _create_http_client():
+    """
+    Create a pooled HTTP client for the provider SDKs.
+
+    Connections are kept alive between transcriptions so TLS handshakes are
+    not repeated. Timeouts and redirect handling match the clients the SDKs
+    would build themselves, since passing ``http_client`` replaces them.
+    HTTP/2 is used when the ``h2`` package is installed
+    (``pip install httpx[http2]``), letting concurrent requests share one
+    connection.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
 class TranscriptionProvider(Protocol):
     """Protocol for transcription providers."""
     
@@ -16,6 +56,7 @@ class TranscriptionProvider(Protocol):
         self,
         audio_path: str,
         language: str = "ja",
+        verbose: bool = False,
     ) -> Tuple[str, float, float]:
         """
         Transcribe audio file.
@@ -33,6 +74,10 @@ class TranscriptionProvider(Protocol):
         """Get provider name."""
         ...
 
+    def close(self) -> None:
+        """Release pooled connections."""
+        ...
+
 
 class GroqProvider:
     """Groq API provider for Whisper transcription."""
@@ -48,6 +93,7 @@ class GroqProvider:
         self.api_key = api_key
         self.model = model
         self._client = None
+        self._http = None
         self._ready = False
         
     def _ensure_client(self):
@@ -55,7 +101,8 @@ class GroqProvider:
         if self._client is None:
             try:
                 from groq import Groq
-                self._client = Groq(api_key=self.api_key)
+                self._http = _create_http_client()
+                self._client = Groq(api_key=self.api_key, http_client=self._http)
                 self._ready = True
                 logger.info(f"Groq client initialized (model={self.model})")
             except ImportError:
@@ -70,6 +117,7 @@ class GroqProvider:
         self,
         audio_path: str,
         language: str = "ja",
+        verbose: bool = False,
     ) -> Tuple[str, float, float]:
         """
         Transcribe audio using Groq API.
@@ -77,6 +125,8 @@ class GroqProvider:
         Args:
             audio_path: Path to audio file
             language: Language code
+            verbose: Request verbose_json (segments, timestamps) instead of
+                plain json; only the text is used either way
             
         Returns:
             Tuple[str, float, float]: (text, confidence, processing_time)
@@ -94,7 +144,7 @@ class GroqProvider:
                     file=(filename, audio_file),
                     model=self.model,
                     language=language,
-                    response_format="verbose_json",
+                    response_format="verbose_json" if verbose else "json",
                 )
             
             processing_time = time.time() - start
@@ -128,6 +178,14 @@ class GroqProvider:
         """Get provider name."""
         return f"groq ({self.model})"
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+        self._http = None
+        self._client = None
+        self._ready = False
+
 
 class OpenAIProvider:
     """OpenAI API provider for Whisper transcription."""
@@ -143,6 +201,7 @@ class OpenAIProvider:
         self.api_key = api_key
         self.model = model
         self._client = None
+        self._http = None
         self._ready = False
         
     def _ensure_client(self):
@@ -150,7 +209,8 @@ class OpenAIProvider:
         if self._client is None:
             try:
                 from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
+                self._http = _create_http_client()
+                self._client = OpenAI(api_key=self.api_key, http_client=self._http)
                 self._ready = True
                 logger.info(f"OpenAI client initialized (model={self.model})")
             except ImportError:
@@ -165,6 +225,7 @@ class OpenAIProvider:
         self,
         audio_path: str,
         language: str = "ja",
+        verbose: bool = False,
     ) -> Tuple[str, float, float]:
         """
         Transcribe audio using OpenAI API.
@@ -172,6 +233,8 @@ class OpenAIProvider:
         Args:
             audio_path: Path to audio file
             language: Language code
+            verbose: Request verbose_json (segments, timestamps) instead of
+                plain json; only the text is used either way
             
         Returns:
             Tuple[str, float, float]: (text, confidence, processing_time)
@@ -182,11 +245,14 @@ class OpenAIProvider:
         
         try:
             with open(audio_path, "rb") as audio_file:
+                # Get filename for the API
+                filename = os.path.basename(audio_path)
+                
                 transcription = self._client.audio.transcriptions.create(
-                    file=audio_file,
+                    file=(filename, audio_file),
                     model=self.model,
                     language=language,
-                    response_format="verbose_json",
+                    response_format="verbose_json" if verbose else "json",
                 )
             
             processing_time = time.time() - start
@@ -219,6 +285,14 @@ class OpenAIProvider:
         """Get provider name."""
         return f"openai ({self.model})"
 
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        if self._http is not None:
+            self._http.close()
+        self._http = None
+        self._client = None
+        self._ready = False
+
 
 def create_provider(
     provider_type: str,
@@ -1,39 +1,77 @@
 """Device detection and optimization utilities."""
-from typing import Tuple
+import importlib.util
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Decided once at import; avoids a failing import on every call without torch
+_HAS_TORCH = importlib.util.find_spec("torch") is not None
+_torch: Optional[ModuleType] = None
 
+
+def _get_torch() -> Optional[ModuleType]:
+    """
+    Import torch on first use and reuse the module.
+
+    Returns:
+        The torch module, or None if PyTorch is not installed
+    """
+    global _torch, _HAS_TORCH
+
+    if not _HAS_TORCH:
+        return None
+    if _torch is None:
+        try:
+            import torch
+        except ImportError as e:
+            # Present but broken install; do not try again
+            logger.warning(f"PyTorch could not be imported: {e}")
+            _HAS_TORCH = False
+            return None
+        _torch = torch
+    return _torch
+
+
+@lru_cache(maxsize=1)
 def detect_device() -> str:
     """
     Detect the best available device for inference.
 
+    The result is cached; available devices do not change while running.
+    Code that swaps out torch (e.g. tests) must call
+    ``detect_device.cache_clear()`` afterwards.
+
     Returns:
         str: Device name ("cuda", "mps", or "cpu")
     """
-    try:
-        import torch
-
-        if torch.cuda.is_available():
-            device_name = torch.cuda.get_device_name(0)
-            logger.info(f"CUDA available: {device_name}")
-            return "cuda"
-        elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-            logger.info("Apple Silicon MPS available")
-            return "mps"
-        else:
-            logger.info("Using CPU for inference")
-            return "cpu"
-    except ImportError:
+    torch = _get_torch()
+    if torch is None:
         logger.warning("PyTorch not installed, defaulting to CPU")
         return "cpu"
 
+    if torch.cuda.is_available():
+        device_name = torch.cuda.get_device_name(0)
+        logger.info(f"CUDA available: {device_name}")
+        return "cuda"
+    elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        logger.info("Apple Silicon MPS available")
+        return "mps"
+    else:
+        logger.info("Using CPU for inference")
+        return "cpu"
 
+
+@lru_cache(maxsize=None)
 def detect_compute_type(device: str) -> str:
     """
     Detect the optimal compute type for the given device.
 
+    The result is cached per device (``detect_compute_type.cache_clear()``
+    resets it).
+
     Args:
         device: Device name ("cuda", "mps", or "cpu")
 
@@ -42,9 +80,7 @@ def detect_compute_type(device: str) -> str:
     """
     if device == "cuda":
         try:
-            import torch
-
-            capability = torch.cuda.get_device_capability()
+            capability = _get_torch().cuda.get_device_capability()
             # Volta (7.0) and newer support efficient float16
             if capability[0] >= 7:
                 logger.info(f"GPU compute capability {capability}, using float16")
@@ -93,13 +129,9 @@ def resolve_device_and_compute_type(
     return resolved_device, resolved_compute_type
 
 
-def get_device_info() -> dict:
-    """
-    Get detailed device information.
-
-    Returns:
-        dict: Device information including GPU name, memory, etc.
-    """
+@lru_cache(maxsize=1)
+def _get_static_device_info() -> dict:
+    """Get device information that does not change while running."""
     info = {
         "device": "cpu",
         "device_name": "CPU",
@@ -107,29 +139,44 @@ def get_device_info() -> dict:
         "mps_available": False,
     }
 
-    try:
-        import torch
-
-        info["cuda_available"] = torch.cuda.is_available()
-        info["mps_available"] = (
-            hasattr(torch.backends, "mps") and torch.backends.mps.is_available()
+    torch = _get_torch()
+    if torch is None:
+        return info
+
+    info["cuda_available"] = torch.cuda.is_available()
+    info["mps_available"] = (
+        hasattr(torch.backends, "mps") and torch.backends.mps.is_available()
+    )
+
+    if info["cuda_available"]:
+        info["device"] = "cuda"
+        info["device_name"] = torch.cuda.get_device_name(0)
+        info["cuda_version"] = torch.version.cuda
+        info["gpu_memory_total_mb"] = (
+            torch.cuda.get_device_properties(0).total_memory // (1024 * 1024)
         )
+    elif info["mps_available"]:
+        info["device"] = "mps"
+        info["device_name"] = "Apple Silicon"
+
+    return info
 
-        if info["cuda_available"]:
-            info["device"] = "cuda"
-            info["device_name"] = torch.cuda.get_device_name(0)
-            info["cuda_version"] = torch.version.cuda
-            info["gpu_memory_total_mb"] = (
-                torch.cuda.get_device_properties(0).total_memory // (1024 * 1024)
-            )
-            info["gpu_memory_allocated_mb"] = (
-                torch.cuda.memory_allocated(0) // (1024 * 1024)
-            )
-        elif info["mps_available"]:
-            info["device"] = "mps"
-            info["device_name"] = "Apple Silicon"
-    except ImportError:
-        pass
+
+def get_device_info() -> dict:
+    """
+    Get detailed device information.
+
+    Static details are detected once; allocated GPU memory is read live.
+
+    Returns:
+        dict: Device information including GPU name, memory, etc.
+    """
+    info = dict(_get_static_device_info())
+
+    if info["cuda_available"]:
+        info["gpu_memory_allocated_mb"] = (
+            _get_torch().cuda.memory_allocated(0) // (1024 * 1024)
+        )
 
     return info
 
@@ -1,9 +1,16 @@
 """Hallucination detection and filtering for Whisper transcription."""
-import re
 import logging
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
 
+try:
+    import ahocorasick  # pyahocorasick: multi-pattern literal matching
+except ImportError:
+    ahocorasick = None
+
+from ..utils.patterns import compile_alternation, literal_text
+from ..utils.text import NormalizedText, normalize_text
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,11 +75,29 @@ class HallucinationFilter:
         self.max_repetition_length = max_repetition_length
         self.stats = HallucinationStats()
         
-        # Compile patterns
-        self._compiled_patterns = [
-            re.compile(p, re.IGNORECASE | re.UNICODE) 
-            for p in self.HALLUCINATION_PATTERNS
-        ]
+        # Plain literal phrases are found with substring search (or an
+        # Aho-Corasick automaton when pyahocorasick is installed); the rest
+        # are compiled into one alternation (one search per text)
+        self._phrases: List[str] = []
+        regex_patterns: List[str] = []
+        for pattern in self.HALLUCINATION_PATTERNS:
+            phrase = literal_text(pattern)
+            if phrase is None:
+                regex_patterns.append(pattern)
+            else:
+                self._phrases.append(phrase)
+
+        self._automaton = None
+        if ahocorasick is not None and self._phrases:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self._phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+
+        self._combined = (
+            compile_alternation(regex_patterns, ignore_case=True)
+            if regex_patterns else None
+        )
 
     def detect_repetition(self, text: str) -> Tuple[bool, Optional[str]]:
         """
@@ -89,27 +114,59 @@ class HallucinationFilter:
         
         # 正規化
         text = text.strip()
-        
+        return self._detect_repetition_stripped(text, len(text))
+
+    def _detect_repetition_stripped(
+        self,
+        text: str,
+        length: int,
+    ) -> Tuple[bool, Optional[str]]:
+        """Detect repetition in stripped text of the given length."""
+        min_count = self.min_repetition_count
+
         # スペースで分割して同じ単語の繰り返しを検出
-        words = text.split()
-        if len(words) >= self.min_repetition_count:
-            # 全ての単語が同じかチェック
-            unique_words = set(words)
-            if len(unique_words) == 1:
-                return True, words[0]
+        # （min_count 語には最低 2 * min_count - 1 文字が必要）
+        if length >= 2 * min_count - 1:
+            words = text.split()
+            if len(words) >= min_count:
+                # 全ての単語が同じかチェック
+                unique_words = set(words)
+                if len(unique_words) == 1:
+                    return True, words[0]
+
+        # 2文字以上のフレーズが min_count 回出現するには 2 * min_count 文字が必要
+        if length < 2 * min_count:
+            return False, None
         
         # サブストリングの繰り返しを検出
         # 例: "abc abc abc" -> "abc" が繰り返し
-        for phrase_len in range(2, min(self.max_repetition_length + 1, len(text) // 2 + 1)):
+        #
+        # 先頭フレーズの出現回数は長さに対して単調非増加
+        # （長いフレーズの各出現は短いフレーズの出現も含む）なので、
+        # 以降の長さで条件を満たせないと分かった時点で打ち切る
+        max_phrase_len = min(self.max_repetition_length, length // 2)
+
+        # 繰り返しがテキストの80%以上を占めるなら、文字の種類は
+        # フレーズ長 + 残り20%の文字数を超えない。先頭部分だけで
+        # それを超えていれば繰り返しではない
+        head = text[:4 * self.max_repetition_length]
+        if len(set(head)) > max_phrase_len + int(length * 0.2):
+            return False, None
+
+        for phrase_len in range(2, max_phrase_len + 1):
             phrase = text[:phrase_len]
             repetitions = text.count(phrase)
-            
+
+            if repetitions < min_count:
+                break
+
             # フレーズがテキストの大部分を占める場合
-            if repetitions >= self.min_repetition_count:
-                expected_len = len(phrase) * repetitions
-                # 繰り返しがテキストの80%以上を占める
-                if expected_len / len(text) >= 0.8:
-                    return True, phrase
+            # 繰り返しがテキストの80%以上を占める
+            if phrase_len * repetitions / length >= 0.8:
+                return True, phrase
+
+            if max_phrase_len * repetitions / length < 0.8:
+                break
         
         return False, None
 
@@ -125,12 +182,23 @@ class HallucinationFilter:
         """
         if not text:
             return False
-        
-        for pattern in self._compiled_patterns:
-            if pattern.search(text):
-                return True
-        
-        return False
+
+        if self._find_phrase(text) is not None:
+            return True
+
+        return self._combined is not None and self._combined.search(text) is not None
+
+    def _find_phrase(self, text: str) -> Optional[str]:
+        """Return the first known literal phrase found in text, if any."""
+        if self._automaton is not None:
+            for _, phrase in self._automaton.iter(text):
+                return phrase
+            return None
+
+        for phrase in self._phrases:
+            if phrase in text:
+                return phrase
+        return None
 
     def filter(self, text: str) -> Tuple[str, bool, Optional[str]]:
         """
@@ -144,8 +212,22 @@ class HallucinationFilter:
         """
         if not self.enabled or not text:
             return text, False, None
+
+        return self.filter_norm(normalize_text(text))
+
+    def filter_norm(self, normalized: NormalizedText) -> Tuple[str, bool, Optional[str]]:
+        """
+        正規化済みテキストをフィルタリング
         
-        original_text = text
+        Args:
+            normalized: Text from normalize_text.
+            
+        Returns:
+            Tuple of (filtered_text, was_filtered, reason).
+        """
+        text = normalized.raw
+        if not self.enabled or not text:
+            return text, False, None
         
         # パターンマッチによるハルシネーション検出
         if self.detect_pattern_hallucination(text):
@@ -154,8 +236,12 @@ class HallucinationFilter:
             logger.debug(f"Pattern hallucination detected: {text[:50]}...")
             return "", True, "pattern_match"
         
-        # 繰り返し検出
-        is_repetition, repeated_phrase = self.detect_repetition(text)
+        # 繰り返し検出（短いテキストは対象外）
+        if len(text) < 6:
+            return text, False, None
+        is_repetition, repeated_phrase = self._detect_repetition_stripped(
+            normalized.stripped, normalized.length
+        )
         if is_repetition:
             self.stats.total_filtered += 1
             self.stats.repetition_filtered += 1
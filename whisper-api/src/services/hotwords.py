@@ -1,13 +1,23 @@
 """Hotwords manager for specialized terminology recognition."""
 import os
-import json
 import logging
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _load_hotwords_json(path: str, mtime_ns: int) -> dict:
+    """Parse a hotwords file; cached until the file's mtime changes."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
 class HotwordsManager:
     """
     専門用語管理
@@ -29,20 +39,29 @@ class HotwordsManager:
             hotwords: Initial list of hotwords.
         """
         self.hotwords: List[str] = hotwords.copy() if hotwords else []
+        # Mirrors self.hotwords for O(1) membership checks
+        self._hotwords_set: Set[str] = set(self.hotwords)
+        # Bumped on every change; invalidates the cached server prompt
+        self._version = 0
+        self._prompt_cache: Optional[Tuple[int, int, str]] = None
         self._config_path = config_path
 
         # Load from config file if provided
-        if config_path and os.path.exists(config_path):
-            self.load_from_file(config_path)
+        if config_path:
+            self.load_from_file(config_path, missing_ok=True)
         
         logger.debug(f"HotwordsManager initialized with {len(self.hotwords)} hotwords")
 
-    def load_from_file(self, path: str) -> None:
+    def load_from_file(self, path: str, missing_ok: bool = False) -> None:
         """
         Load hotwords from a JSON configuration file.
+
+        Parsed files are cached by path and modification time, so loading
+        an unchanged file again skips the read and parse.
         
         Args:
             path: Path to the JSON file.
+            missing_ok: Silently skip a file that does not exist.
             
         Expected JSON format:
         {
@@ -51,17 +70,17 @@ class HotwordsManager:
         }
         """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                new_hotwords = data.get('hotwords', [])
-                
-                # Merge with existing (avoid duplicates)
-                for word in new_hotwords:
-                    if word not in self.hotwords:
-                        self.hotwords.append(word)
-                
-                logger.info(f"Loaded {len(new_hotwords)} hotwords from {path}")
-        except json.JSONDecodeError as e:
+            data = _load_hotwords_json(path, os.stat(path).st_mtime_ns)
+            new_hotwords = data.get('hotwords', [])
+            
+            # Merge with existing (avoid duplicates)
+            self._extend(new_hotwords)
+            
+            logger.info(f"Loaded {len(new_hotwords)} hotwords from {path}")
+        except FileNotFoundError as e:
+            if not missing_ok:
+                logger.error(f"Failed to load hotwords from file: {e}")
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse hotwords JSON: {e}")
         except Exception as e:
             logger.error(f"Failed to load hotwords from file: {e}")
@@ -75,14 +94,8 @@ class HotwordsManager:
         """
         value = os.getenv(env_var, "")
         if value:
-            new_hotwords = [w.strip() for w in value.split(",") if w.strip()]
-            
-            # Merge with existing (avoid duplicates)
-            for word in new_hotwords:
-                if word not in self.hotwords:
-                    self.hotwords.append(word)
-            
-            logger.info(f"Loaded {len(new_hotwords)} hotwords from env var {env_var}")
+            added = self.add_many_from_csv(value)
+            logger.info(f"Loaded {added} hotwords from env var {env_var}")
 
     def save_to_file(self, path: Optional[str] = None) -> None:
         """
@@ -103,11 +116,24 @@ class HotwordsManager:
             "description": "Hotwords for Whisper transcription",
         }
 
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(save_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved {len(self.hotwords)} hotwords to {save_path}")
 
+    def _extend(self, words: Iterable[str]) -> int:
+        """Append words not already present, in order. Returns the number added."""
+        existing = self._hotwords_set
+        added = 0
+        for word in words:
+            if word not in existing:
+                self.hotwords.append(word)
+                existing.add(word)
+                added += 1
+        if added:
+            self._version += 1
+        return added
+
     def add(self, word: str) -> bool:
         """
         Add a hotword.
@@ -118,8 +144,10 @@ class HotwordsManager:
         Returns:
             True if added, False if already exists.
         """
-        if word not in self.hotwords:
+        if word not in self._hotwords_set:
             self.hotwords.append(word)
+            self._hotwords_set.add(word)
+            self._version += 1
             logger.debug(f"Added hotword: {word}")
             return True
         return False
@@ -134,11 +162,21 @@ class HotwordsManager:
         Returns:
             Number of words actually added.
         """
-        added = 0
-        for word in words:
-            if self.add(word):
-                added += 1
-        return added
+        return self._extend(words)
+
+    def add_many_from_csv(self, value: str) -> int:
+        """
+        Add hotwords from a comma-separated string.
+        
+        Surrounding whitespace is stripped and empty entries are skipped.
+        
+        Args:
+            value: Comma-separated words, e.g. "DAO, NFT".
+            
+        Returns:
+            Number of words actually added.
+        """
+        return self._extend(w for w in map(str.strip, value.split(",")) if w)
 
     def remove(self, word: str) -> bool:
         """
@@ -150,8 +188,11 @@ class HotwordsManager:
         Returns:
             True if removed, False if not found.
         """
-        if word in self.hotwords:
+        if word in self._hotwords_set:
             self.hotwords.remove(word)
+            if word not in self.hotwords:
+                self._hotwords_set.discard(word)
+            self._version += 1
             logger.debug(f"Removed hotword: {word}")
             return True
         return False
@@ -159,6 +200,8 @@ class HotwordsManager:
     def clear(self) -> None:
         """Clear all hotwords."""
         self.hotwords.clear()
+        self._hotwords_set.clear()
+        self._version += 1
         logger.debug("Cleared all hotwords")
 
     def get_prompt(self, max_words: int = 50) -> str:
@@ -171,12 +214,7 @@ class HotwordsManager:
         Returns:
             Comma-separated string of hotwords.
         """
-        if not self.hotwords:
-            return ""
-
-        # Limit to max_words
-        words = self.hotwords[:max_words]
-        return ", ".join(words)
+        return self._server_prompt(max_words)
 
     def get_prompt_with_context(self, max_words: int = 20) -> str:
         """
@@ -188,18 +226,15 @@ class HotwordsManager:
         Returns:
             Natural language prompt including hotwords.
         """
-        if not self.hotwords:
+        terms = self._server_prompt(max_words)
+        if not terms:
             return ""
 
-        # Use first max_words
-        words = self.hotwords[:max_words]
-        terms = ", ".join(words)
-        
         return f"この会話では以下の用語が登場します: {terms}。"
 
     def merge_with_request_hotwords(
         self,
-        request_hotwords: Optional[List[str]],
+        request_hotwords: Optional[Sequence[str]],
         max_total: int = 50,
     ) -> str:
         """
@@ -212,16 +247,38 @@ class HotwordsManager:
         Returns:
             Combined prompt string.
         """
-        combined = self.hotwords.copy()
-        
-        if request_hotwords:
-            for word in request_hotwords:
-                if word not in combined:
-                    combined.append(word)
-        
-        # Limit and create prompt
-        combined = combined[:max_total]
-        return ", ".join(combined) if combined else ""
+        base = self._server_prompt(max_total)
+        if not request_hotwords or len(self.hotwords) >= max_total:
+            # Request words would be cut off by the limit anyway
+            return base
+
+        # Every server word fits, so only request words are checked and added.
+        # The server set is consulted directly rather than copied.
+        server = self._hotwords_set
+        extra: List[str] = []
+        seen: Set[str] = set()
+        remaining = max_total - len(self.hotwords)
+        for word in request_hotwords:
+            if word not in server and word not in seen:
+                extra.append(word)
+                seen.add(word)
+                if len(extra) == remaining:
+                    break
+
+        if not extra:
+            return base
+        extra_prompt = ", ".join(extra)
+        return f"{base}, {extra_prompt}" if base else extra_prompt
+
+    def _server_prompt(self, max_total: int) -> str:
+        """Joined server hotwords, cached until the list changes."""
+        cache = self._prompt_cache
+        if cache is not None and cache[0] == self._version and cache[1] == max_total:
+            return cache[2]
+
+        prompt = ", ".join(islice(self.hotwords, max_total))
+        self._prompt_cache = (self._version, max_total, prompt)
+        return prompt
 
     def __len__(self) -> int:
         """Return the number of hotwords."""
@@ -229,7 +286,7 @@ class HotwordsManager:
 
     def __contains__(self, word: str) -> bool:
         """Check if a word is in the hotwords list."""
-        return word in self.hotwords
+        return word in self._hotwords_set
 
     def get_stats(self) -> dict:
         """Get manager statistics."""
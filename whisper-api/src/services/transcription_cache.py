@@ -0,0 +1,95 @@
+"""LRU cache of transcription results keyed by audio content hash."""
+import logging
+from collections import OrderedDict
+from typing import Hashable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (content_hash, language, filter_aizuchi, hotwords)
+CacheKey = Tuple[str, str, bool, Tuple[str, ...]]
+
+
+class TranscriptionCache:
+    """
+    Bounded LRU cache of (text, confidence) results.
+
+    Discord clients retry uploads and batches can contain the same audio more
+    than once; identical content with identical options yields the same
+    transcription, so the model call can be skipped.
+
+    All access happens on the event loop with no awaits in between, so no
+    lock is needed.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        content_hash: str,
+        language: str,
+        filter_aizuchi: bool = True,
+        hotwords: Optional[Sequence[str]] = None,
+    ) -> CacheKey:
+        """Build a cache key from the audio hash and transcription options."""
+        return (content_hash, language, filter_aizuchi, tuple(hotwords or ()))
+
+    def get(self, key: CacheKey) -> Optional[Tuple[str, float]]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (text, confidence) or None if not cached
+        """
+        if self.max_entries <= 0:
+            return None
+
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: CacheKey, text: str, confidence: float) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        if self.max_entries <= 0:
+            return
+
+        self._entries[key] = (text, confidence)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self._entries.clear()
+
+    def __contains__(self, key: CacheKey) -> bool:
+        """Check if a result is cached (does not affect LRU order or stats)."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "enabled": self.max_entries > 0,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,220 @@
+"""Request queue that coalesces transcription jobs into micro-batches."""
+import asyncio
+import contextlib
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from .whisper import WhisperService, TranscriptionRequest
+
+logger = logging.getLogger(__name__)
+
+# Lower values are served first
+PRIORITY_INTERACTIVE = 0  # Single /transcribe requests
+PRIORITY_BATCH = 1  # Items from /transcribe/batch
+
+
+@dataclass
+class TranscriptionJob:
+    """A queued transcription request and the future awaiting its result."""
+
+    request: TranscriptionRequest
+    future: asyncio.Future
+    dispatched: bool = False  # Handed to the worker thread
+
+
+class TranscriptionQueue:
+    """
+    Serializes access to the Whisper service and coalesces concurrent requests.
+
+    Requests are pushed onto an asyncio priority queue and a single background
+    worker collects up to ``max_batch_size`` waiting jobs (waiting at most
+    ``batch_window_ms`` for more to arrive) and transcribes them in one
+    worker-thread call. Inference never runs on the event loop.
+
+    Jobs are only coalesced when the service has a real batch path
+    (``supports_batching``, i.e. cloud providers). Otherwise the items would
+    run one after another anyway, so each job is dispatched on its own with
+    no window, letting higher-priority jobs in between.
+
+    Interactive requests are served before batch items, in arrival order
+    within a priority level, and a batch never mixes priority levels, so a
+    large batch upload cannot hold up single requests for longer than the
+    batch currently being processed.
+
+    Start the worker with ``start()``. If it stops for any reason, queued and
+    in-flight jobs fail instead of waiting forever.
+    """
+
+    def __init__(
+        self,
+        service: WhisperService,
+        max_batch_size: int = 8,
+        batch_window_ms: int = 5,
+    ):
+        """
+        Initialize the transcription queue.
+
+        Args:
+            service: Whisper service used for inference
+            max_batch_size: Maximum number of jobs handled per batch
+            batch_window_ms: How long to wait for more jobs to fill a batch
+                (ignored when the service cannot batch)
+        """
+        self.service = service
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window_seconds = batch_window_ms / 1000
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._worker: Optional[asyncio.Task] = None
+        self._active: List[TranscriptionJob] = []
+
+    def start(self) -> asyncio.Task:
+        """
+        Start the background worker.
+
+        Returns:
+            The worker task (cancel it to stop the queue)
+        """
+        self._worker = asyncio.create_task(self.run())
+        self._worker.add_done_callback(self._fail_pending)
+        return self._worker
+
+    def _fail_pending(self, worker: asyncio.Task) -> None:
+        """Fail every queued and in-flight job once the worker has stopped."""
+        if not worker.cancelled() and worker.exception() is not None:
+            logger.error(f"Transcription queue worker died: {worker.exception()!r}")
+
+        jobs = list(self._active)
+        while not self._queue.empty():
+            jobs.append(self._queue.get_nowait()[2])
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_exception(
+                    RuntimeError("Transcription queue worker stopped")
+                )
+
+    async def submit(
+        self,
+        audio_path: str,
+        language: str = "ja",
+        filter_aizuchi: bool = True,
+        additional_hotwords: Optional[Sequence[str]] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> Tuple[str, float, float]:
+        """
+        Queue an audio file for transcription and wait for the result.
+
+        Args:
+            audio_path: Path to the audio file
+            language: Language hint for transcription
+            filter_aizuchi: Whether to filter out aizuchi (filler words)
+            additional_hotwords: Additional hotwords for this request
+            priority: Queue priority (PRIORITY_INTERACTIVE or PRIORITY_BATCH)
+
+        Returns:
+            Tuple[str, float, float]: (transcribed_text, confidence, processing_time)
+
+        Raises:
+            RuntimeError: If the worker is not running (or stops before the job
+                completes)
+        """
+        if self._worker is None or self._worker.done():
+            raise RuntimeError("Transcription queue worker is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        request = TranscriptionRequest(
+            audio_path=audio_path,
+            language=language,
+            filter_aizuchi=filter_aizuchi,
+            additional_hotwords=additional_hotwords,
+        )
+        job = TranscriptionJob(request=request, future=future)
+        await self._queue.put((priority, next(self._sequence), job))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if job.dispatched:
+                # The worker thread is reading audio_path; hold the caller
+                # (and its temp file cleanup) until it is done with the file
+                with contextlib.suppress(Exception):
+                    await future
+            else:
+                future.cancel()
+            raise
+
+    def qsize(self) -> int:
+        """Return the number of jobs waiting to be processed."""
+        return self._queue.qsize()
+
+    async def _collect_batch(self) -> List[TranscriptionJob]:
+        """
+        Wait for a job, then gather more of the same priority until the batch
+        is full or the window closes.
+
+        Without a real batch path each job is dispatched on its own, so a
+        newly queued interactive request waits for at most one transcription
+        rather than a whole batch run in sequence.
+        """
+        priority, _, first = await self._queue.get()
+        batch = [first]
+        if not self.service.supports_batching:
+            return batch
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window_seconds
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                entry = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if entry[0] != priority:
+                # Leave it (with its original sequence number) for the next batch
+                self._queue.put_nowait(entry)
+                break
+            batch.append(entry[2])
+
+        return batch
+
+    async def run(self) -> None:
+        """
+        Process queued jobs until cancelled.
+
+        Use ``start()`` to run it as a background task.
+        """
+        while True:
+            batch = await self._collect_batch()
+
+            # Skip jobs whose callers have already gone away
+            batch = [job for job in batch if not job.future.done()]
+            if not batch:
+                continue
+
+            if len(batch) > 1:
+                logger.debug(f"Processing transcription batch of {len(batch)}")
+
+            for job in batch:
+                job.dispatched = True
+            self._active = batch
+            try:
+                outcomes = await asyncio.to_thread(
+                    self.service.transcribe_batch,
+                    [job.request for job in batch],
+                )
+            except Exception as e:
+                logger.error(f"Transcription batch failed: {e}")
+                outcomes = [e] * len(batch)
+            self._active = []
+
+            for job, outcome in zip(batch, outcomes):
+                if job.future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    job.future.set_exception(outcome)
+                else:
+                    job.future.set_result(outcome)
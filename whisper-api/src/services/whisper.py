@@ -1,8 +1,10 @@
 """Whisper transcription service."""
 import time
 import logging
-from typing import Optional, Tuple, List, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple, List, Sequence, Union
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..core.config import WhisperConfig
 from .device import resolve_device_and_compute_type
@@ -10,11 +12,38 @@ from .aizuchi_filter import AizuchiFilter
 from .hotwords import HotwordsManager
 from .hallucination_filter import HallucinationFilter
 from .cloud_providers import create_provider, GroqProvider, OpenAIProvider
+from ..utils.text import normalize_text
 
 logger = logging.getLogger(__name__)
 
+# 日本語特化: initial_prompt で日本語会話のコンテキストを提供
+# これにより、Whisper が日本語の音韻を正しく認識しやすくなる
+_BASE_JA_PROMPT = "これは日本語の会話です。Discordのボイスチャンネルで話しています。"
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _build_initial_prompt(language: str, hotwords_prompt: str) -> Optional[str]:
+    """
+    Build the initial_prompt for a transcription.
+
+    Cached because the same server hotwords (and usually the same request
+    hotwords) are sent with every request.
+
+    Args:
+        language: Language code
+        hotwords_prompt: Comma-separated hotwords (may be empty)
+
+    Returns:
+        Prompt string, or None if there is nothing to prompt with
+    """
+    if language == "ja":
+        if hotwords_prompt:
+            return _BASE_JA_PROMPT + " 用語: " + hotwords_prompt
+        return _BASE_JA_PROMPT
+    return hotwords_prompt or None
+
+
+@dataclass(slots=True)
 class TranscriptionStats:
     """Statistics for transcription service."""
 
@@ -54,6 +83,16 @@ class TranscriptionStats:
         return self.successful_requests / self.total_requests
 
 
+@dataclass
+class TranscriptionRequest:
+    """A single transcription request for batch processing."""
+
+    audio_path: str
+    language: str = "ja"
+    filter_aizuchi: bool = True
+    additional_hotwords: Optional[Sequence[str]] = None
+
+
 class WhisperService:
     """Service for Whisper transcription."""
 
@@ -67,6 +106,7 @@ class WhisperService:
         self.config = config
         self.model = None  # For local provider (faster-whisper)
         self.cloud_provider: Optional[Union[GroqProvider, OpenAIProvider]] = None
+        self._cloud_executor: Optional[ThreadPoolExecutor] = None
         self.load_time: Optional[float] = None
         self.stats = TranscriptionStats()
         self._device: Optional[str] = None
@@ -93,8 +133,7 @@ class WhisperService:
         
         # Load hotwords from environment variable
         if config.hotwords:
-            words = [w.strip() for w in config.hotwords.split(",") if w.strip()]
-            self.hotwords.add_many(words)
+            self.hotwords.add_many_from_csv(config.hotwords)
         
         # Also load from env var (backup method)
         self.hotwords.load_from_env()
@@ -146,6 +185,11 @@ class WhisperService:
             
             # Verify provider is ready
             if self.cloud_provider and self.cloud_provider.is_ready():
+                # API calls are I/O bound; batches are sent concurrently
+                self._cloud_executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.config.cloud_max_concurrency),
+                    thread_name_prefix="cloud-transcribe",
+                )
                 self.load_time = time.time() - start
                 logger.info(
                     f"Cloud provider {self.cloud_provider.get_provider_name()} "
@@ -162,7 +206,7 @@ class WhisperService:
         audio_path: str,
         language: str = "ja",
         filter_aizuchi: bool = True,
-        additional_hotwords: Optional[List[str]] = None,
+        additional_hotwords: Optional[Sequence[str]] = None,
     ) -> Tuple[str, float, float]:
         """
         Transcribe an audio file.
@@ -188,26 +232,107 @@ class WhisperService:
             audio_path, language, filter_aizuchi, additional_hotwords
         )
     
+    def transcribe_batch(
+        self,
+        requests: List[TranscriptionRequest],
+    ) -> List[Union[Tuple[str, float, float], Exception]]:
+        """
+        Transcribe several audio files in one call.
+
+        Errors are returned in place of the failed item's result instead of
+        being raised, so one bad file does not fail the whole batch. With a
+        cloud provider the API requests are sent concurrently.
+
+        Args:
+            requests: Transcription requests to process
+
+        Returns:
+            List of (transcribed_text, confidence, processing_time) tuples or
+            exceptions, in the same order as requests
+        """
+        if self.supports_batching and len(requests) > 1:
+            return self._transcribe_cloud_batch(requests)
+
+        outcomes: List[Union[Tuple[str, float, float], Exception]] = []
+        for request in requests:
+            try:
+                outcomes.append(self.transcribe(
+                    request.audio_path,
+                    language=request.language,
+                    filter_aizuchi=request.filter_aizuchi,
+                    additional_hotwords=request.additional_hotwords,
+                ))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _transcribe_cloud_batch(
+        self,
+        requests: List[TranscriptionRequest],
+    ) -> List[Union[Tuple[str, float, float], Exception]]:
+        """
+        Send cloud requests concurrently, then post-process in order.
+
+        Only the API calls run on the executor; filtering and stats stay on
+        the calling thread.
+        """
+        start = time.time()
+        pending = [
+            self._cloud_executor.submit(
+                self.cloud_provider.transcribe, request.audio_path, request.language
+            )
+            for request in requests
+        ]
+
+        outcomes: List[Union[Tuple[str, float, float], Exception]] = []
+        for request, future in zip(requests, pending):
+            try:
+                outcomes.append(self._transcribe_cloud(
+                    request.audio_path,
+                    request.language,
+                    pending=future,
+                    start=start,
+                ))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
     def _transcribe_cloud(
         self,
         audio_path: str,
         language: str = "ja",
+        pending: Optional[Future] = None,
+        start: Optional[float] = None,
     ) -> Tuple[str, float, float]:
-        """Transcribe using cloud provider (Groq/OpenAI)."""
+        """
+        Transcribe using cloud provider (Groq/OpenAI).
+
+        Args:
+            audio_path: Path to the audio file
+            language: Language hint for transcription
+            pending: Already-submitted provider call to wait for instead of
+                calling the provider here
+            start: When the request started (defaults to now)
+        """
         if self.cloud_provider is None:
             raise RuntimeError("Cloud provider not initialized. Call load_model() first.")
         
-        start = time.time()
+        if start is None:
+            start = time.time()
         
         try:
-            text, confidence, processing_time = self.cloud_provider.transcribe(
-                audio_path, language
-            )
+            if pending is not None:
+                text, confidence, processing_time = pending.result()
+            else:
+                text, confidence, processing_time = self.cloud_provider.transcribe(
+                    audio_path, language
+                )
             
             # Apply hallucination filter (post-processing)
-            text, was_hallucination, hallucination_reason = self.hallucination_filter.filter(text)
-            if was_hallucination:
-                logger.debug(f"Hallucination filtered: {hallucination_reason}")
+            if self.hallucination_filter.enabled:
+                text, was_hallucination, hallucination_reason = self.hallucination_filter.filter(text)
+                if was_hallucination:
+                    logger.debug(f"Hallucination filtered: {hallucination_reason}")
             
             # Record stats
             self.stats.record(
@@ -229,7 +354,7 @@ class WhisperService:
         audio_path: str,
         language: str = "ja",
         filter_aizuchi: bool = True,
-        additional_hotwords: Optional[List[str]] = None,
+        additional_hotwords: Optional[Sequence[str]] = None,
     ) -> Tuple[str, float, float]:
         """Transcribe using local faster-whisper model."""
         if self.model is None:
@@ -244,17 +369,8 @@ class WhisperService:
                 max_total=50,
             )
             
-            # 日本語特化: initial_prompt で日本語会話のコンテキストを提供
-            # これにより、Whisper が日本語の音韻を正しく認識しやすくなる
-            if language == "ja":
-                base_prompt = "これは日本語の会話です。Discordのボイスチャンネルで話しています。"
-                if hotwords_prompt:
-                    initial_prompt = f"{base_prompt} 用語: {hotwords_prompt}"
-                else:
-                    initial_prompt = base_prompt
-            else:
-                initial_prompt = hotwords_prompt if hotwords_prompt else None
-            
+            initial_prompt = _build_initial_prompt(language, hotwords_prompt)
+
             # Perform transcription
             segments, info = self.model.transcribe(
                 audio_path,
@@ -269,22 +385,31 @@ class WhisperService:
             )
 
             # Collect segments and calculate confidence
-            text_parts = []
+            text_parts: List[str] = []
             total_logprob = 0.0
-            segment_count = 0
             filtered_count = 0
 
+            # Hoist lookups out of the per-segment loop
+            append = text_parts.append
+            # Checked once per call, so a disabled filter costs nothing per segment
+            is_aizuchi = (
+                self.aizuchi_filter.is_aizuchi_norm
+                if filter_aizuchi and self.aizuchi_filter.enabled
+                else None
+            )
+
             for segment in segments:
-                text = segment.text.strip()
+                normalized = normalize_text(segment.text)
                 
                 # Apply aizuchi filter
-                if filter_aizuchi and self.aizuchi_filter.is_aizuchi(text):
+                if is_aizuchi is not None and is_aizuchi(normalized):
                     filtered_count += 1
                     continue
                 
-                text_parts.append(text)
+                append(normalized.stripped)
                 total_logprob += segment.avg_logprob
-                segment_count += 1
+
+            segment_count = len(text_parts)
 
             text = " ".join(text_parts).strip()
             
@@ -292,9 +417,10 @@ class WhisperService:
                 logger.debug(f"Filtered {filtered_count} aizuchi segments")
             
             # Apply hallucination filter
-            text, was_hallucination, hallucination_reason = self.hallucination_filter.filter(text)
-            if was_hallucination:
-                logger.debug(f"Hallucination filtered: {hallucination_reason}")
+            if self.hallucination_filter.enabled:
+                text, was_hallucination, hallucination_reason = self.hallucination_filter.filter(text)
+                if was_hallucination:
+                    logger.debug(f"Hallucination filtered: {hallucination_reason}")
 
             # Calculate confidence from average log probability
             # log probability is typically between -1 and 0, convert to 0-1 scale
@@ -327,12 +453,25 @@ class WhisperService:
             logger.error(f"Local transcription failed: {e}")
             raise
 
+    def close(self) -> None:
+        """Release cloud provider connections and worker threads."""
+        if self._cloud_executor is not None:
+            self._cloud_executor.shutdown(wait=False)
+            self._cloud_executor = None
+        if self.cloud_provider is not None:
+            self.cloud_provider.close()
+
     def is_ready(self) -> bool:
         """Check if the model/provider is loaded and ready."""
         if self._provider_type in ("groq", "openai"):
             return self.cloud_provider is not None and self.cloud_provider.is_ready()
         return self.model is not None
 
+    @property
+    def supports_batching(self) -> bool:
+        """Whether transcribe_batch runs requests concurrently (cloud providers only)."""
+        return self._cloud_executor is not None and self.cloud_provider is not None
+
     @property
     def device(self) -> str:
         """Get the device being used."""
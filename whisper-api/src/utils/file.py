@@ -4,61 +4,182 @@ import tempfile
 import shutil
 import logging
 import asyncio
-from typing import Optional
-from datetime import datetime, timedelta
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from fastapi import UploadFile
 
 logger = logging.getLogger(__name__)
 
 
+# Read uploads in fixed-size chunks so memory use is bounded by the chunk,
+# not by the size of the uploaded file.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Threads used to unlink expired temp files during a cleanup sweep
+CLEANUP_UNLINK_WORKERS = 4
+
+
+@dataclass
+class SavedUpload:
+    """An upload that has been written to a temporary file."""
+
+    path: str
+    size_bytes: int
+    content_hash: str  # BLAKE2b hex digest of the file content
+
+
+class FileTooLargeError(Exception):
+    """
+    Raised when an upload exceeds the configured size limit.
+
+    The upload is aborted as soon as the limit is crossed, so ``bytes_read``
+    is how much was read by then, not the size of the whole file.
+    """
+
+    def __init__(self, bytes_read: int, max_bytes: int):
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.bytes_read = bytes_read
+        self.max_bytes = max_bytes
+
+
+def _create_temp_file(temp_dir: str, suffix: str) -> Tuple[int, str]:
+    """Create a new temp file, creating temp_dir only if it has gone missing."""
+    # temp_dir is created at startup, so only recreate it if it was removed since
+    try:
+        return tempfile.mkstemp(suffix=suffix, dir=temp_dir)
+    except FileNotFoundError:
+        os.makedirs(temp_dir, exist_ok=True)
+        return tempfile.mkstemp(suffix=suffix, dir=temp_dir)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
 async def save_upload_file(
-    content: bytes,
-    filename: str,
+    upload: UploadFile,
     temp_dir: str,
-) -> str:
+    max_bytes: int,
+    suffix: Optional[str] = None,
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> SavedUpload:
     """
-    Save uploaded file content to a temporary file.
+    Stream an uploaded file to a temporary file.
+
+    The upload is copied chunk by chunk and the size limit is enforced while
+    writing, so oversized uploads are aborted without being fully read. The
+    content hash is computed from the same chunks, without a second pass.
 
     Args:
-        content: File content as bytes
-        filename: Original filename (for extension)
+        upload: Uploaded file
         temp_dir: Directory to save temporary files
+        max_bytes: Maximum allowed size in bytes
+        suffix: Temp file extension (derived from upload.filename if None)
+        on_chunk: Called with each chunk as it is written, e.g. to inspect
+            headers without reopening the file
 
     Returns:
-        Path to the saved temporary file
-    """
-    # Ensure temp directory exists
-    os.makedirs(temp_dir, exist_ok=True)
+        SavedUpload with the temporary file path, size and content hash
 
+    Raises:
+        FileTooLargeError: If the upload exceeds max_bytes
+    """
     # Get file extension
-    suffix = os.path.splitext(filename or ".ogg")[1]
+    if suffix is None:
+        suffix = os.path.splitext(upload.filename or ".ogg")[1]
+
+    # Creating the file touches the disk, so do it off the loop
+    fd, path = await asyncio.to_thread(_create_temp_file, temp_dir, suffix)
+    total = 0
+    digest = hashlib.blake2b()
+    try:
+        try:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_bytes:
+                    raise FileTooLargeError(total, max_bytes)
+                digest.update(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+                # Chunks are already bytes; write them to the raw fd unbuffered
+                await asyncio.to_thread(_write_all, fd, chunk)
+        finally:
+            await asyncio.to_thread(os.close, fd)
+    except BaseException:
+        await cleanup_temp_file(path)
+        raise
+
+    return SavedUpload(path=path, size_bytes=total, content_hash=digest.hexdigest())
 
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(
-        delete=False,
-        suffix=suffix,
-        dir=temp_dir,
-    ) as tmp:
-        tmp.write(content)
-        return tmp.name
 
+def _remove_file(file_path: str) -> bool:
+    """Delete a file, logging instead of raising on failure."""
+    try:
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
+        return False
 
-def cleanup_temp_file(file_path: str) -> bool:
+
+async def cleanup_temp_file(file_path: str) -> bool:
     """
     Clean up a temporary file.
 
+    The unlink runs in a worker thread so it never blocks the event loop.
+
     Args:
         file_path: Path to the file to delete
 
     Returns:
         True if file was deleted successfully
     """
+    return await asyncio.to_thread(_remove_file, file_path)
+
+
+def find_old_temp_files(
+    temp_dir: str,
+    max_age_seconds: int = 3600,
+) -> List[str]:
+    """
+    Find temporary files older than the given age.
+
+    Args:
+        temp_dir: Directory containing temporary files
+        max_age_seconds: Maximum age of files to keep (default: 1 hour)
+
+    Returns:
+        Paths of files older than max_age_seconds
+    """
+    expired: List[str] = []
+    cutoff = time.time() - max_age_seconds
+
     try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-            return True
+        # DirEntry caches file type and stat, avoiding extra syscalls per file
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        expired.append(entry.path)
+                except OSError as e:
+                    logger.warning(f"Error cleaning up {entry.name}: {e}")
+
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
-    return False
+        logger.error(f"Error during temp cleanup: {e}")
+
+    return expired
 
 
 def cleanup_old_temp_files(
@@ -68,6 +189,8 @@ def cleanup_old_temp_files(
     """
     Clean up old temporary files.
 
+    Expired files are unlinked in parallel on a small thread pool.
+
     Args:
         temp_dir: Directory containing temporary files
         max_age_seconds: Maximum age of files to keep (default: 1 hour)
@@ -75,28 +198,17 @@ def cleanup_old_temp_files(
     Returns:
         Number of files deleted
     """
-    deleted = 0
-    cutoff = datetime.now() - timedelta(seconds=max_age_seconds)
+    expired = find_old_temp_files(temp_dir, max_age_seconds)
+    if not expired:
+        return 0
 
-    try:
-        if not os.path.exists(temp_dir):
-            return 0
-
-        for filename in os.listdir(temp_dir):
-            file_path = os.path.join(temp_dir, filename)
-
-            try:
-                if os.path.isfile(file_path):
-                    mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    if mtime < cutoff:
-                        os.unlink(file_path)
-                        deleted += 1
-                        logger.debug(f"Deleted old temp file: {filename}")
-            except Exception as e:
-                logger.warning(f"Error cleaning up {filename}: {e}")
-
-    except Exception as e:
-        logger.error(f"Error during temp cleanup: {e}")
+    if len(expired) == 1:
+        deleted = int(_remove_file(expired[0]))
+    else:
+        # Unlinks are independent, so overlap them on a few threads
+        workers = min(CLEANUP_UNLINK_WORKERS, len(expired))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            deleted = sum(executor.map(_remove_file, expired))
 
     if deleted > 0:
         logger.info(f"Cleaned up {deleted} old temp files")
@@ -104,6 +216,26 @@ def cleanup_old_temp_files(
     return deleted
 
 
+async def remove_old_temp_files(
+    temp_dir: str,
+    max_age_seconds: int = 3600,
+) -> int:
+    """
+    Clean up old temporary files without blocking the event loop.
+
+    The whole sweep runs in one worker thread, so the loop only waits on a
+    single future however many files expire.
+
+    Args:
+        temp_dir: Directory containing temporary files
+        max_age_seconds: Maximum age of files to keep
+
+    Returns:
+        Number of files deleted
+    """
+    return await asyncio.to_thread(cleanup_old_temp_files, temp_dir, max_age_seconds)
+
+
 async def periodic_cleanup(
     temp_dir: str,
     interval_seconds: int = 300,
@@ -122,7 +254,7 @@ async def periodic_cleanup(
     while True:
         await asyncio.sleep(interval_seconds)
         try:
-            cleanup_old_temp_files(temp_dir, max_age_seconds)
+            await remove_old_temp_files(temp_dir, max_age_seconds)
         except Exception as e:
             logger.error(f"Periodic cleanup error: {e}")
 
@@ -0,0 +1,151 @@
+"""Regex helpers shared by the transcription filters."""
+import logging
+import re
+from typing import FrozenSet, Iterable, Optional
+
+try:
+    import re2  # google-re2: builds a DFA, matches in linear time
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+# Alternation used when there are no patterns; never matches
+_NEVER_MATCH = r"[^\s\S]"
+
+
+def compile_alternation(patterns: Iterable[str], ignore_case: bool = False):
+    """
+    Compile patterns into a single alternation.
+
+    Each pattern is wrapped in a non-capturing group with its anchors intact,
+    so the result matches wherever any of the originals would. RE2 is used
+    when installed; patterns it cannot handle (e.g. lookarounds or
+    backreferences) fall back to the standard ``re`` engine.
+
+    Args:
+        patterns: Regex patterns to combine
+        ignore_case: Whether matching is case-insensitive
+
+    Returns:
+        Compiled pattern exposing ``match``/``search``
+    """
+    body = "|".join(f"(?:{p})" for p in patterns) or _NEVER_MATCH
+    if ignore_case:
+        body = f"(?i){body}"
+
+    if re2 is not None:
+        try:
+            return re2.compile(body)
+        except Exception as e:
+            logger.debug(f"RE2 cannot compile pattern, using re: {e}")
+
+    return re.compile(body)
+
+
+# Escapes that stand for a single literal character
+_LITERAL_ESCAPES = frozenset("()[]{}.*+?^$|\\/-ー〜")
+# Quantifiers that allow the preceding item to be absent
+_OPTIONAL_QUANTIFIERS = ("*", "?", "{0", "{,")
+
+
+def leading_chars(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Determine the characters a start-anchored match of a pattern can begin with.
+
+    Only simple patterns are understood: an optional ``^`` followed by a
+    literal character, an escaped punctuation character, or a character
+    class without ranges or escapes, and no alternation. Anything else
+    returns None, meaning the first character cannot be predicted.
+
+    Args:
+        pattern: Regex pattern as used with ``match``
+
+    Returns:
+        Set of possible first characters, or None if unknown
+    """
+    body = pattern[1:] if pattern.startswith("^") else pattern
+    if not body or "|" in body:
+        return None
+
+    head = body[0]
+    if head == "\\":
+        if len(body) < 2 or body[1] not in _LITERAL_ESCAPES:
+            return None
+        chars, rest = frozenset(body[1]), body[2:]
+    elif head == "[":
+        end = body.find("]", 1)
+        members = body[1:end]
+        if end == -1 or not members or members[0] == "^" or any(c in members for c in "\\-[&~|"):
+            return None
+        chars, rest = frozenset(members), body[end + 1:]
+    elif head in "().|*+?{$":
+        return None
+    else:
+        chars, rest = frozenset(head), body[1:]
+
+    if rest.startswith(_OPTIONAL_QUANTIFIERS):
+        return None
+    return chars
+
+
+_METACHARACTERS = frozenset(".^$*+?{}[]()|")
+
+
+def literal_text(pattern: str) -> Optional[str]:
+    """
+    Get the text a pattern matches if it is a plain literal.
+
+    Escaped punctuation (e.g. ``\\[``) is unescaped. Patterns containing any
+    other regex syntax, or letters whose case would matter under
+    case-insensitive matching, return None.
+
+    Args:
+        pattern: Regex pattern as used with ``search``
+
+    Returns:
+        The literal text, or None if the pattern is not a plain literal
+    """
+    chars = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char not in _LITERAL_ESCAPES:
+                return None
+            chars.append(char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in _METACHARACTERS:
+            return None
+        else:
+            chars.append(char)
+
+    text = "".join(chars)
+    if escaped or not text or text.lower() != text.upper():
+        return None
+    return text
+
+
+def fullmatch_body(pattern: str) -> str:
+    """
+    Rewrite a pattern used with ``match`` so it can be used with ``fullmatch``.
+
+    Simple ``^...$`` patterns lose their anchors. Anything else is followed
+    by ``(?s:.*)`` so it keeps matching any text that merely starts with a
+    match.
+
+    Assumes the text has no trailing newline (``$`` also matches before
+    one), e.g. because it has been stripped.
+
+    Args:
+        pattern: Regex pattern as used with ``match``
+
+    Returns:
+        Equivalent pattern for ``fullmatch``
+    """
+    body = pattern[1:] if pattern.startswith("^") else pattern
+    trailing_backslashes = len(body[:-1]) - len(body[:-1].rstrip("\\"))
+    if "|" not in body and body.endswith("$") and trailing_backslashes % 2 == 0:
+        return body[:-1]
+    return f"(?:{pattern})(?s:.*)"
@@ -0,0 +1,24 @@
+"""Text normalization shared by the transcription filters."""
+from typing import NamedTuple
+
+
+class NormalizedText(NamedTuple):
+    """Text together with its stripped form and length, computed once."""
+
+    raw: str
+    stripped: str
+    length: int
+
+
+def normalize_text(text: str) -> NormalizedText:
+    """
+    Strip text once so a chain of filters does not repeat the work.
+
+    Args:
+        text: Text as produced by the transcriber
+
+    Returns:
+        NormalizedText with the stripped text and its length
+    """
+    stripped = text.strip()
+    return NormalizedText(text, stripped, len(stripped))
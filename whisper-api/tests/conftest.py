@@ -2,6 +2,8 @@
 import pytest
 import os
 import tempfile
+import wave
+from io import BytesIO
 from typing import Generator
 
 from fastapi.testclient import TestClient
@@ -14,37 +16,41 @@ def temp_dir() -> Generator[str, None, None]:
         yield tmpdir
 
 
-@pytest.fixture
-def sample_audio_path(temp_dir: str) -> str:
-    """Create a sample audio file for testing."""
-    # Create a minimal WAV file (silence)
-    import wave
-    import struct
-
-    filepath = os.path.join(temp_dir, "test_audio.wav")
-
-    # Create 1 second of silence at 16kHz mono
-    sample_rate = 16000
-    duration = 1  # seconds
-    num_samples = sample_rate * duration
-
-    with wave.open(filepath, "w") as wav_file:
+def _create_silent_wav_bytes(duration_seconds: int = 1, sample_rate: int = 16000) -> bytes:
+    """Create a minimal WAV file (silence) at 16kHz mono."""
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)  # 16-bit
         wav_file.setframerate(sample_rate)
 
-        # Write silence (zeros)
-        for _ in range(num_samples):
-            wav_file.writeframes(struct.pack("h", 0))
+        # Write silence (zeros) in a single call
+        wav_file.writeframes(bytes(sample_rate * duration_seconds * 2))
 
-    return filepath
+    return buffer.getvalue()
+
+
+_sample_wav_key = pytest.StashKey[bytes]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Build the sample WAV once; bytes are immutable, so tests can share it."""
+    config.stash[_sample_wav_key] = _create_silent_wav_bytes()
+
+
+@pytest.fixture
+def sample_audio_bytes(pytestconfig: pytest.Config) -> bytes:
+    """Get sample audio (1 second of silence) as bytes."""
+    return pytestconfig.stash[_sample_wav_key]
 
 
 @pytest.fixture
-def sample_audio_bytes(sample_audio_path: str) -> bytes:
-    """Get sample audio as bytes."""
-    with open(sample_audio_path, "rb") as f:
-        return f.read()
+def sample_audio_path(temp_dir: str, sample_audio_bytes: bytes) -> str:
+    """Create a sample audio file for testing."""
+    filepath = os.path.join(temp_dir, "test_audio.wav")
+    with open(filepath, "wb") as f:
+        f.write(sample_audio_bytes)
+    return filepath
 
 
 # Note: For full integration tests, you would need to:
@@ -0,0 +1,85 @@
+"""
+Tests for AizuchiFilter.
+
+テスト項目:
+- 相槌の検出
+- 通常の発話を残す
+- パターンの追加・削除
+"""
+import re
+
+import pytest
+
+from src.services.aizuchi_filter import AizuchiFilter
+
+
+@pytest.fixture
+def aizuchi_filter() -> AizuchiFilter:
+    return AizuchiFilter()
+
+
+class TestAizuchiFilter:
+    """Tests for AizuchiFilter."""
+
+    @pytest.mark.parametrize("text", ["うん", "はい。", "なるほどね", " えーっと ", "(笑)", "www"])
+    def test_detects_aizuchi(self, aizuchi_filter, text):
+        """Test that common aizuchi are detected."""
+        assert aizuchi_filter.is_aizuchi(text) is True
+
+    @pytest.mark.parametrize("text", ["", "はいそうです", "今日の議題について", "うんうん分かった"])
+    def test_keeps_regular_speech(self, aizuchi_filter, text):
+        """Test that regular speech is not filtered."""
+        assert aizuchi_filter.is_aizuchi(text) is False
+
+    def test_filter_segments(self, aizuchi_filter):
+        """Test that only aizuchi segments are removed."""
+        segments = [(0.0, 1.0, "はい"), (1.0, 3.0, "次の議題です"), (3.0, 4.0, "うん")]
+
+        assert aizuchi_filter.filter_segments(segments) == [(1.0, 3.0, "次の議題です")]
+
+    def test_aizuchi_mask(self, aizuchi_filter):
+        """Test batch checking keeps input order, including duplicates."""
+        texts = ["はい", "次の議題です", "はい", "うん", "  はい" + " " * 20]
+
+        assert aizuchi_filter.aizuchi_mask(texts) == [True, False, True, True, True]
+
+    def test_disabled_filter_keeps_everything(self):
+        """Test that a disabled filter removes nothing."""
+        segments = [(0.0, 1.0, "はい"), (1.0, 2.0, "うん")]
+
+        assert AizuchiFilter(enabled=False).filter_segments(segments) == segments
+
+    def test_add_and_remove_pattern(self, aizuchi_filter):
+        """Test that added and removed patterns take effect immediately."""
+        assert aizuchi_filter.is_aizuchi("おけ") is False
+
+        aizuchi_filter.add_pattern(r"^おけ[。．、]*$")
+        assert aizuchi_filter.is_aizuchi("おけ") is True
+
+        assert aizuchi_filter.remove_pattern(r"^おけ[。．、]*$") is True
+        assert aizuchi_filter.is_aizuchi("おけ") is False
+
+    def test_add_invalid_pattern(self, aizuchi_filter):
+        """Test that an invalid pattern is rejected and leaves the filter unchanged."""
+        count = len(aizuchi_filter.patterns)
+
+        with pytest.raises(re.error):
+            aizuchi_filter.add_pattern("おけ)(")
+
+        assert len(aizuchi_filter.patterns) == count
+        assert aizuchi_filter.is_aizuchi("はい") is True
+
+    def test_add_pattern_does_not_leak_between_instances(self, aizuchi_filter):
+        """Test that adding a pattern does not modify the defaults."""
+        aizuchi_filter.add_pattern(r"^おけ$")
+
+        assert r"^おけ$" not in AizuchiFilter.DEFAULT_PATTERNS
+        assert AizuchiFilter().is_aizuchi("おけ") is False
+
+    def test_pattern_without_predictable_first_char(self, aizuchi_filter):
+        """Test that a pattern starting with a group still matches."""
+        aizuchi_filter.add_pattern(r"(?:OK|おけ)$")
+
+        assert aizuchi_filter.is_aizuchi("OK") is True
+        assert aizuchi_filter.is_aizuchi("はい") is True
+        assert aizuchi_filter.is_aizuchi("OKです") is False
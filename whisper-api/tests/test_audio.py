@@ -0,0 +1,176 @@
+"""
+Tests for audio utilities.
+
+テスト項目:
+- WAV / Ogg / FLAC の長さをヘッダーから取得
+- 既知の長さによるバリデーション
+- ファイルからの長さ取得 (ヘッダー・ffprobe フォールバック)
+- 対応フォーマットの判定
+"""
+import struct
+import wave
+from io import BytesIO
+
+import pytest
+
+from src.services import audio
+from src.services.audio import (
+    AudioDurationProbe,
+    get_audio_duration,
+    is_supported_format,
+    validate_audio_file,
+)
+
+
+def _create_wav_bytes(duration_seconds: float, sample_rate: int = 16000) -> bytes:
+    """Create silent 16-bit mono WAV bytes."""
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"\x00\x00" * int(sample_rate * duration_seconds))
+    return buffer.getvalue()
+
+
+def _ogg_page(granule: int, body: bytes, sequence: int) -> bytes:
+    """Build a single Ogg page (CRC left as zero)."""
+    segments = [255] * (len(body) // 255) + [len(body) % 255]
+    header = b"OggS" + struct.pack(
+        "<BBqIIIB", 0, 0, granule, 1, sequence, 0, len(segments)
+    )
+    return header + bytes(segments) + body
+
+
+def _create_opus_bytes(duration_seconds: float, pre_skip: int = 312) -> bytes:
+    """Create a minimal Ogg Opus stream whose last granule encodes the duration."""
+    opus_head = b"OpusHead" + struct.pack("<BBHIhB", 1, 1, pre_skip, 48000, 0, 0)
+    granule = int(duration_seconds * 48000) + pre_skip
+    return (
+        _ogg_page(0, opus_head, 0)
+        + _ogg_page(0, b"OpusTags" + b"\x00" * 8, 1)
+        + _ogg_page(granule, b"\x00" * 600, 2)
+    )
+
+
+def _create_flac_header(duration_seconds: float, sample_rate: int = 16000) -> bytes:
+    """Create a FLAC stream marker and STREAMINFO block (no audio frames)."""
+    total_samples = int(duration_seconds * sample_rate)
+    packed = (sample_rate << 44) | (0 << 41) | (15 << 36) | total_samples
+    streaminfo = b"\x00" * 10 + packed.to_bytes(8, "big") + b"\x00" * 16
+    return b"fLaC" + bytes([0x80]) + len(streaminfo).to_bytes(3, "big") + streaminfo
+
+
+def _probe(content: bytes, chunk_size: int = 1024) -> AudioDurationProbe:
+    """Feed content to a probe in chunks."""
+    probe = AudioDurationProbe()
+    for i in range(0, len(content), chunk_size):
+        probe.feed(content[i:i + chunk_size])
+    return probe
+
+
+class TestAudioDurationProbe:
+    """Tests for AudioDurationProbe."""
+
+    def test_wav_duration(self):
+        """Test WAV duration is read from the RIFF header."""
+        content = _create_wav_bytes(2.5)
+        assert _probe(content).duration(len(content)) == 2.5
+
+    def test_opus_duration(self):
+        """Test Ogg Opus duration is read from the last granule position."""
+        content = _create_opus_bytes(1.5)
+        assert _probe(content, chunk_size=100).duration(len(content)) == 1.5
+
+    def test_flac_duration(self):
+        """Test FLAC duration is read from STREAMINFO."""
+        content = _create_flac_header(3.0)
+        assert _probe(content).duration(len(content)) == 3.0
+
+    def test_unknown_format(self):
+        """Test unknown formats fall back to None."""
+        content = b"ID3" + b"\x00" * 1000
+        assert _probe(content).duration(len(content)) is None
+
+    def test_truncated_ogg(self):
+        """Test a stream whose last page is cut short is not trusted."""
+        content = _create_opus_bytes(1.5)[:-10]
+        assert _probe(content).duration(len(content)) is None
+
+
+class TestGetAudioDuration:
+    """Tests for get_audio_duration."""
+
+    def test_reads_header_without_ffprobe(self, tmp_path, monkeypatch):
+        """Test WAV duration is read from the file header."""
+        path = tmp_path / "test.wav"
+        path.write_bytes(_create_wav_bytes(1.5))
+        monkeypatch.setattr(audio, "_probe_with_av", lambda _: pytest.fail("PyAV called"))
+        monkeypatch.setattr(audio, "_run_ffprobe", lambda _: pytest.fail("ffprobe called"))
+
+        assert get_audio_duration(str(path)) == 1.5
+
+    def test_falls_back_to_ffprobe(self, tmp_path, monkeypatch):
+        """Test unknown formats use ffprobe when PyAV fails."""
+        path = tmp_path / "test.mp3"
+        path.write_bytes(b"ID3" + b"\x00" * 100)
+        calls = []
+        monkeypatch.setattr(audio, "_probe_with_av", lambda _: None)
+        monkeypatch.setattr(audio, "_run_ffprobe", lambda p: calls.append(p) or 4.0)
+
+        assert get_audio_duration(str(path)) == 4.0
+        assert calls == [str(path)]
+
+    def test_skip_header(self, tmp_path, monkeypatch):
+        """Test parse_header=False goes straight to PyAV without reading the header."""
+        path = tmp_path / "test.wav"
+        path.write_bytes(_create_wav_bytes(1.5))
+        monkeypatch.setattr(audio, "_read_duration_from_header", lambda *_: pytest.fail("header read"))
+        monkeypatch.setattr(audio, "_probe_with_av", lambda _: 2.0)
+
+        assert get_audio_duration(str(path), parse_header=False) == 2.0
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file returns None."""
+        assert get_audio_duration(str(tmp_path / "missing.wav")) is None
+
+
+class TestValidateAudioFile:
+    """Tests for validate_audio_file with pre-computed metadata."""
+
+    def test_known_duration_skips_file_access(self):
+        """Test validation uses the given size and duration without touching the file."""
+        is_valid, error_code, _ = validate_audio_file(
+            "/nonexistent.wav",
+            min_duration_ms=500,
+            file_size_bytes=1024,
+            duration=0.2,
+        )
+
+        assert is_valid is False
+        assert error_code == "AUDIO_TOO_SHORT"
+
+    def test_known_duration_valid(self):
+        """Test a file within limits passes."""
+        is_valid, error_code, _ = validate_audio_file(
+            "/nonexistent.wav",
+            file_size_bytes=1024,
+            duration=2.0,
+        )
+
+        assert is_valid is True
+        assert error_code is None
+
+
+class TestSupportedFormats:
+    """Tests for format checks."""
+
+    @pytest.mark.parametrize("filename", ["a.ogg", "B.WAV", "c.d.opus", "x.webm"])
+    def test_supported(self, filename):
+        """Test supported extensions in any case."""
+        assert is_supported_format(filename) is True
+
+    @pytest.mark.parametrize("filename", ["", "noext", "a.txt", "a.ogg.exe"])
+    def test_unsupported(self, filename):
+        """Test unsupported or missing extensions."""
+        assert is_supported_format(filename) is False
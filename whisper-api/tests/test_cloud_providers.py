@@ -0,0 +1,73 @@
+"""
+Tests for cloud provider clients.
+
+テスト項目:
+- 共有 HTTP クライアントの設定 (タイムアウト・リダイレクト・接続プール)
+- verbose による response_format の切り替えと信頼度
+"""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from src.services.cloud_providers import GroqProvider, OpenAIProvider, _create_http_client
+
+
+class TestHttpClient:
+    """Tests for the pooled HTTP client handed to the SDKs."""
+
+    def test_keeps_sdk_defaults(self):
+        """Test that the client carries the SDK timeout and redirect defaults."""
+        client = _create_http_client()
+        try:
+            assert client.timeout == httpx.Timeout(600.0, connect=5.0)
+            assert client.follow_redirects is True
+        finally:
+            client.close()
+
+    def test_openai_provider_uses_client(self):
+        """Test that the OpenAI SDK is given the shared client and it is closed on close()."""
+        pytest.importorskip("openai")
+        provider = OpenAIProvider(api_key="key")
+
+        assert provider.is_ready()
+        http = provider._http
+        assert provider._client._client is http
+
+        provider.close()
+        assert http.is_closed
+
+
+class TestProviderTranscribe:
+    """Tests for the provider transcribe() request and response handling."""
+
+    @pytest.mark.parametrize("provider_cls,confidence", [
+        pytest.param(GroqProvider, 0.90, id="groq"),
+        pytest.param(OpenAIProvider, 0.92, id="openai"),
+    ])
+    @pytest.mark.parametrize("verbose,response_format", [
+        (False, "json"),
+        (True, "verbose_json"),
+    ])
+    def test_response_format_and_confidence(
+        self, tmp_path, provider_cls, confidence, verbose, response_format
+    ):
+        """Test the requested format and that text-only responses (no segments) get the fixed confidence."""
+        path = tmp_path / "audio.ogg"
+        path.write_bytes(b"OggS")
+        provider = provider_cls(api_key="key")
+        provider._client = Mock()  # Skips SDK/HTTP client creation
+        create = provider._client.audio.transcriptions.create
+        create.return_value = SimpleNamespace(text=" こんにちは ")
+
+        text, conf, _ = provider.transcribe(str(path), language="ja", verbose=verbose)
+
+        assert (text, conf) == ("こんにちは", confidence)
+        kwargs = create.call_args.kwargs
+        assert kwargs["response_format"] == response_format
+        assert kwargs["file"][0] == "audio.ogg"
+
+        create.return_value = SimpleNamespace(text="  ")
+        assert provider.transcribe(str(path), verbose=verbose)[:2] == ("", 0.0)
@@ -0,0 +1,117 @@
+"""
+Tests for device detection.
+
+テスト項目:
+- PyTorch なしでの CPU フォールバック
+- CUDA の検出と compute type の選択
+- 検出結果のキャッシュ
+"""
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import device
+from src.services.device import (
+    detect_compute_type,
+    detect_device,
+    get_device_info,
+    resolve_device_and_compute_type,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_device_caches(monkeypatch):
+    """Reset the detection caches and torch state around every test."""
+    monkeypatch.setattr(device, "_HAS_TORCH", device._HAS_TORCH)
+    monkeypatch.setattr(device, "_torch", device._torch)
+    caches = (detect_device, detect_compute_type, device._get_static_device_info)
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+def _fake_torch(capability=(8, 0), calls=None):
+    """Build a minimal torch stand-in with one CUDA GPU."""
+    def is_available():
+        if calls is not None:
+            calls.append("is_available")
+        return True
+
+    cuda = SimpleNamespace(
+        is_available=is_available,
+        get_device_name=lambda index: "Test GPU",
+        get_device_capability=lambda: capability,
+        get_device_properties=lambda index: SimpleNamespace(total_memory=8 * 1024 ** 3),
+        memory_allocated=lambda index: 1024 ** 3,
+    )
+    return SimpleNamespace(
+        cuda=cuda,
+        backends=SimpleNamespace(),
+        version=SimpleNamespace(cuda="12.1"),
+    )
+
+
+def _use_torch(monkeypatch, torch) -> None:
+    monkeypatch.setattr(device, "_HAS_TORCH", True)
+    monkeypatch.setattr(device, "_torch", torch)
+
+
+class TestDeviceDetection:
+    """Tests for detect_device and detect_compute_type."""
+
+    def test_without_torch(self, monkeypatch):
+        """Test that a missing PyTorch falls back to CPU/int8."""
+        monkeypatch.setattr(device, "_HAS_TORCH", False)
+
+        assert resolve_device_and_compute_type() == ("cpu", "int8")
+        assert get_device_info() == {
+            "device": "cpu",
+            "device_name": "CPU",
+            "cuda_available": False,
+            "mps_available": False,
+        }
+
+    def test_broken_torch_install(self, monkeypatch):
+        """Test that a torch that fails to import is treated as missing and not retried."""
+        monkeypatch.setattr(device, "_HAS_TORCH", True)
+        monkeypatch.setattr(device, "_torch", None)
+        monkeypatch.setitem(sys.modules, "torch", None)  # import raises ImportError
+
+        assert detect_device() == "cpu"
+        assert device._HAS_TORCH is False
+
+    @pytest.mark.parametrize("capability,compute_type", [
+        ((8, 0), "float16"),
+        ((6, 1), "int8"),
+    ])
+    def test_cuda(self, monkeypatch, capability, compute_type):
+        """Test CUDA detection and the capability-based compute type."""
+        _use_torch(monkeypatch, _fake_torch(capability))
+
+        assert resolve_device_and_compute_type() == ("cuda", compute_type)
+        info = get_device_info()
+        assert info["device_name"] == "Test GPU"
+        assert info["gpu_memory_total_mb"] == 8192
+        assert info["gpu_memory_allocated_mb"] == 1024
+
+    def test_detection_is_cached(self, monkeypatch):
+        """Test that torch is queried once until the cache is cleared."""
+        calls = []
+        _use_torch(monkeypatch, _fake_torch(calls=calls))
+
+        assert detect_device() == detect_device() == "cuda"
+        assert calls == ["is_available"]
+
+        monkeypatch.setattr(device, "_HAS_TORCH", False)
+        assert detect_device() == "cuda"  # Still cached
+        detect_device.cache_clear()
+        assert detect_device() == "cpu"
+
+    def test_explicit_settings_skip_detection(self, monkeypatch):
+        """Test that explicit device/compute type never touch torch."""
+        monkeypatch.setattr(device, "_get_torch", lambda: pytest.fail("torch queried"))
+
+        assert resolve_device_and_compute_type("cuda", "int8_float16") == ("cuda", "int8_float16")
@@ -0,0 +1,112 @@
+"""
+Tests for file utilities.
+
+テスト項目:
+- アップロードのストリーミング保存
+- ファイルサイズ上限の検出
+- 古い一時ファイルの削除
+"""
+import os
+import time
+import hashlib
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+
+from src.utils.file import (
+    save_upload_file,
+    cleanup_temp_file,
+    remove_old_temp_files,
+    FileTooLargeError,
+    UPLOAD_CHUNK_SIZE,
+)
+
+
+def _create_files(directory, names, age_seconds: float = 0) -> None:
+    """Create empty files, backdating their mtime by age_seconds."""
+    mtime = time.time() - age_seconds
+    for name in names:
+        path = os.path.join(directory, name)
+        open(path, "wb").close()
+        os.utime(path, (mtime, mtime))
+
+
+def _make_upload(content: bytes, filename: str = "audio.wav") -> UploadFile:
+    """Create an UploadFile backed by in-memory content."""
+    return UploadFile(file=BytesIO(content), filename=filename)
+
+
+class TestSaveUploadFile:
+    """Tests for save_upload_file."""
+
+    @pytest.mark.asyncio
+    async def test_saves_content_in_chunks(self, tmp_path):
+        """Test that multi-chunk uploads are written intact."""
+        content = os.urandom(UPLOAD_CHUNK_SIZE * 2 + 123)
+        upload = _make_upload(content)
+
+        saved = await save_upload_file(upload, str(tmp_path), max_bytes=len(content))
+
+        assert saved.size_bytes == len(content)
+        assert saved.path.endswith(".wav")
+        assert saved.content_hash == hashlib.blake2b(content).hexdigest()
+        with open(saved.path, "rb") as f:
+            assert f.read() == content
+
+    @pytest.mark.asyncio
+    async def test_recreates_missing_temp_dir(self, tmp_path):
+        """Test that a temp dir removed after startup is created again."""
+        temp_dir = tmp_path / "removed"
+
+        saved = await save_upload_file(_make_upload(b"abc"), str(temp_dir), max_bytes=1024)
+
+        assert os.path.dirname(saved.path) == str(temp_dir)
+        assert saved.size_bytes == 3
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_upload(self, tmp_path):
+        """Test that oversized uploads raise and leave no temp file behind."""
+        upload = _make_upload(b"\x00" * 2048)
+
+        with pytest.raises(FileTooLargeError) as exc_info:
+            await save_upload_file(upload, str(tmp_path), max_bytes=1024)
+
+        assert exc_info.value.bytes_read > 1024
+        assert exc_info.value.max_bytes == 1024
+        assert os.listdir(tmp_path) == []
+
+
+class TestTempCleanup:
+    """Tests for temp file cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_temp_file(self, tmp_path):
+        """Test that a file is deleted once and a missing file is reported as not deleted."""
+        _create_files(tmp_path, ["audio.ogg"])
+        path = str(tmp_path / "audio.ogg")
+
+        assert await cleanup_temp_file(path) is True
+        assert await cleanup_temp_file(path) is False
+
+    @pytest.mark.asyncio
+    async def test_removes_only_old_files(self, tmp_path):
+        """Test that files older than max age are deleted and newer ones kept."""
+        _create_files(tmp_path, ["old1.ogg", "old2.ogg"], age_seconds=7200)
+        _create_files(tmp_path, ["new.ogg"])
+
+        deleted = await remove_old_temp_files(str(tmp_path), max_age_seconds=3600)
+
+        assert deleted == 2
+        assert os.listdir(tmp_path) == ["new.ogg"]
+
+    @pytest.mark.asyncio
+    async def test_keeps_directories_and_handles_missing_dir(self, tmp_path):
+        """Test that subdirectories are never removed and a missing dir is a no-op."""
+        subdir = tmp_path / "nested"
+        subdir.mkdir()
+        os.utime(subdir, (time.time() - 7200, time.time() - 7200))
+
+        assert await remove_old_temp_files(str(tmp_path), max_age_seconds=3600) == 0
+        assert subdir.is_dir()
+        assert await remove_old_temp_files(str(tmp_path / "missing"), max_age_seconds=3600) == 0
@@ -0,0 +1,73 @@
+"""
+Tests for HallucinationFilter.
+
+テスト項目:
+- 繰り返しの検出
+- 定型フレーズの検出
+- 通常の発話を残す
+"""
+import pytest
+
+from src.services.hallucination_filter import HallucinationFilter
+
+
+@pytest.fixture
+def hallucination_filter() -> HallucinationFilter:
+    return HallucinationFilter()
+
+
+class TestDetectRepetition:
+    """Tests for HallucinationFilter.detect_repetition."""
+
+    def test_repeated_words(self, hallucination_filter):
+        """Test that the same word repeated with spaces is detected."""
+        assert hallucination_filter.detect_repetition("しょうがない しょうがない しょうがない") == (
+            True, "しょうがない",
+        )
+
+    def test_repeated_phrase_without_spaces(self, hallucination_filter):
+        """Test that a phrase tiling the text is detected."""
+        assert hallucination_filter.detect_repetition("なるほどなるほどなるほど") == (
+            True, "なるほど",
+        )
+
+    def test_repetition_with_trailing_text(self, hallucination_filter):
+        """Test that repetition covering most of the text is detected."""
+        is_repetition, phrase = hallucination_filter.detect_repetition(
+            "しょうがないしょうがないしょうがないね"
+        )
+
+        assert is_repetition is True
+        assert phrase == "しょうがない"
+
+    @pytest.mark.parametrize("text", [
+        "今日の会議の議題は三つあります",
+        "はいはい、それで次の話ですが",
+        "a" * 5,
+    ])
+    def test_regular_speech(self, hallucination_filter, text):
+        """Test that regular speech is not detected as repetition."""
+        assert hallucination_filter.detect_repetition(text) == (False, None)
+
+
+class TestFilter:
+    """Tests for HallucinationFilter.filter."""
+
+    @pytest.mark.parametrize("text", ["ご視聴ありがとうございました", "[音楽]", "♪♪♪", "..."])
+    def test_pattern_hallucination(self, hallucination_filter, text):
+        """Test that stock hallucination phrases are removed."""
+        assert hallucination_filter.filter(text) == ("", True, "pattern_match")
+
+    def test_repetition_is_collapsed(self, hallucination_filter):
+        """Test that repetition is reduced to a single phrase."""
+        text, was_filtered, reason = hallucination_filter.filter("はいはいはいはいはい")
+
+        assert text == "はい"
+        assert was_filtered is True
+        assert reason == "repetition:はい"
+
+    def test_regular_text_passes(self, hallucination_filter):
+        """Test that regular text is returned unchanged."""
+        assert hallucination_filter.filter("明日の予定を確認します") == (
+            "明日の予定を確認します", False, None,
+        )
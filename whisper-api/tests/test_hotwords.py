@@ -0,0 +1,115 @@
+"""
+Tests for HotwordsManager.
+
+テスト項目:
+- 重複のない追加・削除
+- ファイル・環境変数からの読み込み
+- リクエスト hotwords とのマージ
+"""
+import json
+import os
+
+import pytest
+
+from src.services.hotwords import HotwordsManager
+
+
+@pytest.fixture
+def manager() -> HotwordsManager:
+    return HotwordsManager(hotwords=["DAO", "NFT"])
+
+
+class TestHotwordsManager:
+    """Tests for HotwordsManager."""
+
+    def test_add_skips_duplicates(self, manager):
+        """Test that existing words are not added twice."""
+        assert manager.add("DAO") is False
+        assert manager.add("Discord") is True
+        assert manager.add_many(["NFT", "Ethereum", "Ethereum"]) == 1
+
+        assert manager.hotwords == ["DAO", "NFT", "Discord", "Ethereum"]
+
+    def test_remove_and_clear(self, manager):
+        """Test that removed words can be added again."""
+        assert manager.remove("DAO") is True
+        assert "DAO" not in manager
+        assert manager.remove("DAO") is False
+        assert manager.add("DAO") is True
+
+        manager.clear()
+        assert len(manager) == 0
+        assert "NFT" not in manager
+
+    def test_load_from_file(self, tmp_path, manager):
+        """Test that file hotwords are merged in order without duplicates."""
+        path = tmp_path / "hotwords.json"
+        path.write_text(
+            json.dumps({"hotwords": ["NFT", "OpenSea", "KIBOTCHA"]}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+        manager.load_from_file(str(path))
+
+        assert manager.hotwords == ["DAO", "NFT", "OpenSea", "KIBOTCHA"]
+
+    def test_load_from_env(self, monkeypatch, manager):
+        """Test that comma-separated env hotwords are merged."""
+        monkeypatch.setenv("TEST_HOTWORDS", " DAO, ガバナンス ,,Discord ")
+
+        manager.load_from_env("TEST_HOTWORDS")
+
+        assert manager.hotwords == ["DAO", "NFT", "ガバナンス", "Discord"]
+
+    def test_add_many_from_csv(self, manager):
+        """Test that a comma-separated string is split, stripped and deduplicated."""
+        assert manager.add_many_from_csv("NFT, Solana,, Solana ,DAO") == 1
+
+        assert manager.hotwords == ["DAO", "NFT", "Solana"]
+
+    def test_merge_with_request_hotwords(self, manager):
+        """Test that request hotwords are appended once and the total is capped."""
+        assert manager.merge_with_request_hotwords(["NFT", "Solana", "Solana"]) == "DAO, NFT, Solana"
+        assert manager.merge_with_request_hotwords(["Solana"], max_total=2) == "DAO, NFT"
+        assert manager.merge_with_request_hotwords(None) == "DAO, NFT"
+        assert manager.hotwords == ["DAO", "NFT"]
+
+    def test_merge_reflects_changes(self, manager):
+        """Test that the cached server prompt is rebuilt after the list changes."""
+        assert manager.merge_with_request_hotwords(None) == "DAO, NFT"
+
+        manager.add("Solana")
+        assert manager.merge_with_request_hotwords(None) == "DAO, NFT, Solana"
+        manager.remove("DAO")
+        assert manager.merge_with_request_hotwords(["DAO"]) == "NFT, Solana, DAO"
+        manager.clear()
+        assert manager.merge_with_request_hotwords(["DAO"]) == "DAO"
+
+    def test_load_from_file_reparses_after_change(self, tmp_path, manager):
+        """Test that an edited file is read again rather than served from cache."""
+        path = tmp_path / "hotwords.json"
+        path.write_text(json.dumps({"hotwords": ["OpenSea"]}), encoding="utf-8")
+        manager.load_from_file(str(path))
+
+        path.write_text(json.dumps({"hotwords": ["Solana"]}), encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        manager.load_from_file(str(path))
+
+        assert manager.hotwords == ["DAO", "NFT", "OpenSea", "Solana"]
+
+    def test_missing_config_file(self, tmp_path):
+        """Test that a missing config file is skipped."""
+        manager = HotwordsManager(config_path=str(tmp_path / "missing.json"))
+
+        assert len(manager) == 0
+
+    def test_save_and_reload(self, tmp_path, manager):
+        """Test that saved hotwords (including Japanese) load back unchanged."""
+        manager.add("ガバナンス")
+        path = tmp_path / "saved.json"
+
+        manager.save_to_file(str(path))
+
+        assert "ガバナンス" in path.read_text(encoding="utf-8")
+        assert HotwordsManager(config_path=str(path)).hotwords == ["DAO", "NFT", "ガバナンス"]
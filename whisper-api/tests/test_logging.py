@@ -0,0 +1,62 @@
+"""
+Tests for logging formatters.
+
+テスト項目:
+- JSON 形式の出力 (UTC "Z" タイムスタンプ・例外・extra)
+"""
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+
+from src.core.logging import JsonFormatter
+
+
+def _make_record(**attrs) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="whisper_api.test",
+        level=logging.ERROR,
+        pathname=__file__,
+        lineno=1,
+        msg="Transcription failed for %s",
+        args=("user1",),
+        exc_info=attrs.pop("exc_info", None),
+    )
+    record.created = 1733389200.123
+    record.__dict__.update(attrs)
+    return record
+
+
+class TestJsonFormatter:
+    """Tests for JsonFormatter."""
+
+    def test_round_trip(self):
+        """Test that a record formats to JSON with a UTC Z timestamp and the message."""
+        data = json.loads(JsonFormatter().format(_make_record()))
+
+        assert data == {
+            "timestamp": "2024-12-05T09:00:00.123000Z",
+            "level": "ERROR",
+            "logger": "whisper_api.test",
+            "message": "Transcription failed for user1",
+        }
+        assert datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00")).tzinfo == timezone.utc
+
+    def test_exception_and_extra(self):
+        """Test that exc_info becomes a traceback string and extra fields are merged in."""
+        try:
+            raise RuntimeError("CUDA out of memory")
+        except RuntimeError:
+            exc_info = sys.exc_info()
+
+        record = _make_record(
+            exc_info=exc_info,
+            extra={"user_id": "123", "processing_time_ms": 1250, "text": "こんにちは"},
+        )
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["exception"].startswith("Traceback (most recent call last):")
+        assert data["exception"].rstrip().endswith("RuntimeError: CUDA out of memory")
+        assert data["user_id"] == "123"
+        assert data["processing_time_ms"] == 1250
+        assert data["text"] == "こんにちは"
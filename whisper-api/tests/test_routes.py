@@ -2,305 +2,536 @@
 Tests for API routes.
 
 テスト項目:
-- /health エンドポイント
+- /health・/status エンドポイント (スナップショットの TTL)
 - /transcribe エンドポイント
-- /status エンドポイント
 - /transcribe/batch エンドポイント
+- /transcribe/batch ストリーミング (NDJSON)
+- 同一音声のキャッシュ・バッチ内重複排除
 - 入力バリデーション
+- エラーレスポンス
 """
+import asyncio
+import hashlib
 import pytest
 import json
-import wave
-import struct
 import math
-import tempfile
-import os
+import time
+import wave
+from functools import lru_cache
 from io import BytesIO
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.core.config import Config, ServerConfig
+from src.services.transcription_cache import TranscriptionCache
+from src.services.transcription_queue import PRIORITY_BATCH
+from src.services.whisper import TranscriptionStats
+
+
+_TONE_HZ = 440
+
+
+@lru_cache(maxsize=None)
+def _tone_period(sample_rate: int) -> np.ndarray:
+    """One whole number of 440Hz cycles that repeats exactly (400 samples at 16kHz)."""
+    period = sample_rate // math.gcd(sample_rate, _TONE_HZ)
+    t = np.arange(period) / sample_rate
+    return (10000 * np.sin(2 * np.pi * _TONE_HZ * t)).astype(np.int16)
 
 
+@lru_cache(maxsize=32)
 def _create_wav_bytes(
     duration_seconds: float = 1.0,
     sample_rate: int = 16000,
     silence: bool = False
 ) -> bytes:
-    """Create WAV file bytes for testing."""
+    """Create WAV file bytes for testing (cached; the bytes are immutable)."""
     num_samples = int(sample_rate * duration_seconds)
+    if silence:
+        samples = np.zeros(num_samples, dtype=np.int16)
+    else:
+        # 440Hz tone, tiled from one exact period
+        samples = np.resize(_tone_period(sample_rate), num_samples)
     
     buffer = BytesIO()
     with wave.open(buffer, "wb") as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)  # 16-bit
         wav_file.setframerate(sample_rate)
-        
-        for i in range(num_samples):
-            if silence:
-                value = 0
-            else:
-                # 440Hz tone
-                value = int(10000 * math.sin(2 * math.pi * 440 * i / sample_rate))
-            wav_file.writeframes(struct.pack("h", value))
+        wav_file.writeframes(samples.tobytes())
     
-    buffer.seek(0)
-    return buffer.read()
-
-
-def _create_ogg_bytes() -> bytes:
-    """Create minimal OGG file bytes for testing (actually just header)."""
-    # This is a minimal OGG header for testing purposes
-    # Real OGG encoding would require more complex handling
-    return b'OggS' + b'\x00' * 100
-
-
-class TestHealthEndpoint:
-    """Tests for the /health endpoint."""
-
-    @patch("src.main.app")
-    def test_health_endpoint_structure(self, mock_app):
-        """Test that health endpoint returns expected structure."""
-        # Mock the whisper service
-        mock_service = MagicMock()
-        mock_service.is_ready.return_value = True
-        mock_service.get_status.return_value = {
-            "model_name": "large-v3",
-            "model_loaded": True,
-            "device": "cuda",
-            "compute_type": "float16",
-            "load_time_seconds": 5.0,
-            "stats": {
-                "total_requests": 100,
-                "successful_requests": 95,
-                "failed_requests": 5,
-                "avg_processing_time_ms": 500.0,
-                "success_rate": 0.95,
-                "total_audio_processed_seconds": 1000.0,
-            },
-        }
-        
-        # Verify the structure
-        status = mock_service.get_status()
-        assert "model_name" in status
-        assert "model_loaded" in status
-        assert "device" in status
-        assert "stats" in status
+    return buffer.getvalue()
+
+
+# Request payloads shared by the tests below
+_TRANSCRIBE_REQUEST = {
+    "user_id": "123456789",
+    "username": "test_user",
+    "start_ts": 1733389200000,
+    "end_ts": 1733389201000,
+    "language": "ja",
+}
+
+_BATCH_METADATA = [
+    {
+        "user_id": "123",
+        "username": "Alice",
+        "start_ts": 1000,
+        "end_ts": 2000,
+        "language": "ja",
+    },
+    {
+        "user_id": "456",
+        "username": "Bob",
+        "start_ts": 1500,
+        "end_ts": 2500,
+        "language": "ja",
+    },
+]
+
+# Serialized once for the batch integration test
+_BATCH_METADATA_JSON = json.dumps(_BATCH_METADATA)
+
+
+class FakeWhisperService:
+    """Minimal stand-in for the attributes the routes read."""
+
+    device = "cpu"
+    compute_type = "int8"
+    load_time = 0.1
+    supports_batching = False
+
+    def __init__(self, ready: bool = True):
+        self.ready = ready
+        self.stats = TranscriptionStats()
+
+    def is_ready(self) -> bool:
+        return self.ready
+
+
+class FakeQueue:
+    """Queue stand-in recording every submitted job."""
+
+    def __init__(self):
+        self.submits: List[dict] = []
+
+    async def submit(self, audio_path: str, **options):
+        self.submits.append({"audio_path": audio_path, **options})
+        text = f"text{len(self.submits)}"
+        await asyncio.sleep(0)  # Let other batch items run, as the real queue would
+        return text, 0.9, 0.25
+
+
+@pytest.fixture
+def fake_queue() -> FakeQueue:
+    return FakeQueue()
+
+
+@pytest.fixture
+def api_client(tmp_path, monkeypatch, fake_queue) -> TestClient:
+    """TestClient for the router, wired to the fakes and a per-test temp dir."""
+    monkeypatch.setattr(routes, "whisper_service", FakeWhisperService())
+    monkeypatch.setattr(routes, "config", Config(server=ServerConfig(temp_dir=str(tmp_path))))
+    monkeypatch.setattr(routes, "start_time", 0.0)
+    monkeypatch.setattr(routes, "transcription_queue", fake_queue)
+    monkeypatch.setattr(routes, "transcription_cache", TranscriptionCache())
+    monkeypatch.setattr(routes, "_health_snapshot", None)
+    monkeypatch.setattr(routes, "_status_snapshot", None)
+
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+
+def _post_transcribe(client: TestClient, audio: bytes, **data):
+    """POST one WAV to /transcribe with _TRANSCRIBE_REQUEST form fields."""
+    return client.post(
+        "/transcribe",
+        files={"audio_file": ("audio.wav", audio, "audio/wav")},
+        data={**_TRANSCRIBE_REQUEST, **data},
+    )
+
+
+def _post_batch(client: TestClient, audio: List[bytes], **data):
+    """POST one WAV per metadata entry (reusing _BATCH_METADATA cyclically)."""
+    metadata = [_BATCH_METADATA[i % len(_BATCH_METADATA)] for i in range(len(audio))]
+    return client.post(
+        "/transcribe/batch",
+        files=[("files", (f"audio{i}.wav", content, "audio/wav")) for i, content in enumerate(audio)],
+        data={"metadata": json.dumps(metadata), **data},
+    )
+
+
+class TestHealthEndpoints:
+    """Tests for the /health and /status endpoints."""
+
+    def test_health(self, api_client):
+        """Test that /health reports the model state and request stats."""
+        response = api_client.get("/health")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "healthy"
+        assert body["model_loaded"] is True
+        assert body["model_name"] == routes.config.whisper.model_name
+        assert (body["device"], body["compute_type"]) == ("cpu", "int8")
+        assert body["requests_processed"] == 0
+
+    def test_status(self, api_client):
+        """Test that /status reports server, model and stats sections."""
+        response = api_client.get("/status")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["server"]["python_version"] == routes.PYTHON_VERSION
+        assert body["model"]["loaded"] is True
+        assert body["model"]["device"] == "cpu"
+        assert body["stats"]["total_requests"] == 0
+
+    @pytest.mark.parametrize("path,loaded", [
+        pytest.param("/health", lambda body: body["model_loaded"], id="health"),
+        pytest.param("/status", lambda body: body["model"]["loaded"], id="status"),
+    ])
+    def test_snapshot_reused_within_ttl(self, api_client, monkeypatch, path, loaded):
+        """Test that the snapshot is served within SNAPSHOT_TTL_SECONDS and rebuilt after it."""
+        now = [1000.0]
+        clock = SimpleNamespace(
+            monotonic=lambda: now[0], time=time.time, perf_counter=time.perf_counter
+        )
+        monkeypatch.setattr(routes, "time", clock)
+
+        assert loaded(api_client.get(path).json()) is True
+        routes.whisper_service.ready = False
+
+        now[0] += routes.SNAPSHOT_TTL_SECONDS / 2
+        assert loaded(api_client.get(path).json()) is True
+
+        now[0] += routes.SNAPSHOT_TTL_SECONDS
+        assert loaded(api_client.get(path).json()) is False
 
 
 class TestTranscribeEndpoint:
     """Tests for the /transcribe endpoint."""
 
-    def test_transcribe_request_validation(self):
-        """Test request validation for transcribe endpoint."""
-        # Valid request structure
-        audio_bytes = _create_wav_bytes(duration_seconds=1.0)
-        
-        # Create a mock request structure
-        request_data = {
-            "user_id": "123456789",
-            "username": "test_user",
-            "start_ts": 1733389200000,
-            "end_ts": 1733389201000,
-            "language": "ja",
-        }
-        
-        # Verify required fields
-        assert "user_id" in request_data
-        assert "username" in request_data
-        assert "start_ts" in request_data
-        assert "end_ts" in request_data
-
-    def test_transcribe_accepts_wav_format(self):
-        """Test that transcribe accepts WAV format."""
-        audio_bytes = _create_wav_bytes(duration_seconds=1.0)
-        
-        # Verify it's a valid WAV file
-        buffer = BytesIO(audio_bytes)
-        with wave.open(buffer, "rb") as wav:
-            assert wav.getnchannels() == 1
-            assert wav.getsampwidth() == 2
-            assert wav.getframerate() == 16000
+    def test_transcribe_success(self, api_client, fake_queue, tmp_path):
+        """Test that the result echoes the request fields and the temp file is removed."""
+        response = _post_transcribe(api_client, _create_wav_bytes(duration_seconds=1.0))
 
-    def test_transcribe_accepts_ogg_format(self):
-        """Test that transcribe accepts OGG format."""
-        audio_bytes = _create_ogg_bytes()
-        
-        # Verify it starts with OGG magic bytes
-        assert audio_bytes.startswith(b'OggS')
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        data = body["data"]
+        assert data["user_id"] == _TRANSCRIBE_REQUEST["user_id"]
+        assert data["text"] == "text1"
+        assert data["duration_ms"] == 1000
+        assert data["confidence"] == 0.9
+
+        (submit,) = fake_queue.submits
+        assert submit["language"] == "ja"
+        assert submit["filter_aizuchi"] is True
+        assert submit["additional_hotwords"] is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unsupported_format(self, api_client, fake_queue):
+        """Test that unsupported extensions are rejected before saving."""
+        response = api_client.post(
+            "/transcribe",
+            files={"audio_file": ("notes.txt", b"hello", "text/plain")},
+            data=_TRANSCRIBE_REQUEST,
+        )
 
-    def test_audio_duration_calculation(self):
-        """Test audio duration is correctly calculated."""
-        audio_bytes = _create_wav_bytes(duration_seconds=3.0)
-        
-        buffer = BytesIO(audio_bytes)
-        with wave.open(buffer, "rb") as wav:
-            frames = wav.getnframes()
-            rate = wav.getframerate()
-            duration = frames / rate
-            
-            assert abs(duration - 3.0) < 0.1
-
-
-class TestStatusEndpoint:
-    """Tests for the /status endpoint."""
-
-    def test_status_returns_comprehensive_info(self):
-        """Test that status returns comprehensive information."""
-        # Mock status response
-        status = {
-            "status": "ok",
-            "model_loaded": True,
-            "model_name": "large-v3",
-            "device": "cuda",
-            "compute_type": "float16",
-            "uptime_seconds": 3600.0,
-            "requests_processed": 500,
-            "avg_processing_time_ms": 450.0,
-        }
-        
-        # Verify all expected fields
-        assert "status" in status
-        assert "model_loaded" in status
-        assert "model_name" in status
-        assert "device" in status
+        body = response.json()
+        assert body["success"] is False
+        assert body["error"]["code"] == "INVALID_FORMAT"
+        assert fake_queue.submits == []
+
+    def test_file_too_large(self, api_client, fake_queue, monkeypatch, tmp_path):
+        """Test that an upload over the limit reports the limit and leaves no temp file."""
+        monkeypatch.setattr(routes.config.server, "max_file_size_mb", 0)
+
+        body = _post_transcribe(api_client, _create_wav_bytes(duration_seconds=1.0)).json()
+
+        assert body["success"] is False
+        assert body["error"]["code"] == "FILE_TOO_LARGE"
+        assert body["error"]["details"] == {"max_size_mb": 0}
+        assert fake_queue.submits == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_audio_too_short(self, api_client, fake_queue):
+        """Test that audio shorter than min_audio_duration_ms is not transcribed."""
+        body = _post_transcribe(api_client, _create_wav_bytes(duration_seconds=0.1)).json()
+
+        assert body["success"] is False
+        assert body["error"]["code"] == "AUDIO_TOO_SHORT"
+        assert fake_queue.submits == []
 
 
 class TestBatchEndpoint:
     """Tests for the /transcribe/batch endpoint."""
 
-    def test_batch_metadata_structure(self):
-        """Test batch metadata structure validation."""
-        metadata = [
-            {
-                "user_id": "123",
-                "username": "Alice",
-                "start_ts": 1000,
-                "end_ts": 2000,
-                "language": "ja",
-            },
-            {
-                "user_id": "456",
-                "username": "Bob",
-                "start_ts": 1500,
-                "end_ts": 2500,
-                "language": "ja",
-            },
+    def test_batch_results(self, api_client, fake_queue, tmp_path):
+        """Test that results are returned in index order with metadata and counts."""
+        response = _post_batch(api_client, [
+            _create_wav_bytes(duration_seconds=1.0),
+            _create_wav_bytes(duration_seconds=1.5),
+        ])
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        data = body["data"]
+        assert (data["total_count"], data["successful_count"], data["failed_count"]) == (2, 2, 0)
+        assert [r["index"] for r in data["results"]] == [0, 1]
+        assert [r["username"] for r in data["results"]] == ["Alice", "Bob"]
+        assert all(r["duration_ms"] == 1000 for r in data["results"])
+        assert [s["priority"] for s in fake_queue.submits] == [PRIORITY_BATCH] * 2
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("concurrency,file_count,expected_peak", [
+        pytest.param(2, 5, 2, id="bounded"),
+        pytest.param(8, 3, 3, id="fewer_files_than_limit"),
+        pytest.param(0, 3, 1, id="at_least_one"),
+    ])
+    def test_prep_concurrency_bound(
+        self, api_client, monkeypatch, concurrency, file_count, expected_peak
+    ):
+        """Test that at most batch_prep_concurrency items are saved at once."""
+        monkeypatch.setattr(routes.config.server, "batch_prep_concurrency", concurrency)
+        save_upload_file = routes.save_upload_file
+        active = peak = 0
+
+        async def slow_save(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            try:
+                await asyncio.sleep(0.01)
+                return await save_upload_file(*args, **kwargs)
+            finally:
+                active -= 1
+
+        monkeypatch.setattr(routes, "save_upload_file", slow_save)
+
+        audio = [_create_wav_bytes(duration_seconds=1.0 + i / 10) for i in range(file_count)]
+        data = _post_batch(api_client, audio).json()["data"]
+
+        assert data["successful_count"] == file_count
+        assert peak == expected_peak
+
+    @pytest.mark.parametrize("metadata,code", [
+        pytest.param("not json", "INVALID_METADATA", id="invalid_json"),
+        pytest.param(json.dumps(_BATCH_METADATA), "METADATA_MISMATCH", id="count_mismatch"),
+    ])
+    def test_metadata_errors(self, api_client, fake_queue, metadata, code):
+        """Test that unusable metadata fails the whole batch."""
+        response = api_client.post(
+            "/transcribe/batch",
+            files=[("files", ("audio0.wav", _create_wav_bytes(duration_seconds=1.0), "audio/wav"))],
+            data={"metadata": metadata},
+        )
+
+        body = response.json()
+        assert body["success"] is False
+        assert body["error"]["code"] == code
+        assert fake_queue.submits == []
+
+
+class TestBatchStream:
+    """Tests for /transcribe/batch with stream=true."""
+
+    def test_streams_one_line_per_item_and_summary(self, api_client, fake_queue, tmp_path):
+        """Test that each item (cached ones included) is one NDJSON line, followed by the summary."""
+        first = _create_wav_bytes(duration_seconds=1.0)
+        assert _post_batch(api_client, [first]).json()["data"]["successful_count"] == 1
+
+        response = _post_batch(
+            api_client,
+            [first, _create_wav_bytes(duration_seconds=1.5), _create_wav_bytes(duration_seconds=0.1)],
+            stream="true",
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 4
+
+        *results, summary = lines
+        by_index = {r["index"]: r for r in results}
+        assert sorted(by_index) == [0, 1, 2]
+        assert by_index[0]["success"] and by_index[0]["cached"] is True
+        assert by_index[0]["text"] == "text1"
+        assert by_index[1]["success"] and by_index[1]["cached"] is False
+        assert by_index[1]["processing_time_ms"] >= 250
+        assert by_index[2]["success"] is False  # Shorter than min_audio_duration_ms
+        assert summary["total_count"] == 3
+        assert summary["successful_count"] == 2
+        assert summary["failed_count"] == 1
+
+        assert len(fake_queue.submits) == 2  # Only the uncached valid item was transcribed
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_cleanup_without_reading_body(self, api_client, fake_queue, tmp_path):
+        """Test that temp files are removed even if the stream body is never iterated."""
+        files = [
+            UploadFile(file=BytesIO(_create_wav_bytes(duration_seconds=d)), filename=f"audio{i}.wav")
+            for i, d in enumerate((1.0, 1.5))
         ]
-        
-        # Verify metadata structure
-        for item in metadata:
-            assert "user_id" in item
-            assert "username" in item
-            assert "start_ts" in item
-            assert "end_ts" in item
-
-    def test_batch_response_structure(self):
-        """Test batch response structure."""
-        # Mock batch response
-        response = {
-            "success": True,
-            "data": {
-                "total_count": 2,
-                "success_count": 2,
-                "failed_count": 0,
-                "results": [
-                    {
-                        "user_id": "123",
-                        "text": "こんにちは",
-                        "confidence": 0.95,
-                    },
-                    {
-                        "user_id": "456",
-                        "text": "テストです",
-                        "confidence": 0.92,
-                    },
-                ],
-            },
-        }
-        
-        assert response["success"] is True
-        assert response["data"]["total_count"] == 2
-        assert len(response["data"]["results"]) == 2
+
+        response = await routes.transcribe_batch(
+            files=files, metadata=json.dumps(_BATCH_METADATA), stream=True
+        )
+        assert len(list(tmp_path.iterdir())) == 2
+
+        await response.background()  # What Starlette runs after the response
+
+        assert list(tmp_path.iterdir()) == []
+        assert fake_queue.submits == []
+
+
+class TestRouteCache:
+    """Tests for the content-hash transcription cache on the routes."""
+
+    def test_identical_upload_skips_submit(self, api_client, fake_queue):
+        """Test that a repeated upload is served from cache and option changes miss."""
+        audio = _create_wav_bytes(duration_seconds=1.0)
+
+        first = _post_transcribe(api_client, audio).json()
+        second = _post_transcribe(api_client, audio).json()
+
+        assert len(fake_queue.submits) == 1
+        assert first["data"]["cached"] is False
+        assert second["data"]["cached"] is True
+        assert second["data"]["text"] == first["data"]["text"]
+
+        _post_transcribe(api_client, audio, language="en")
+        _post_transcribe(api_client, audio, hotwords="DAO, NFT")
+        _post_transcribe(api_client, audio, hotwords="DAO,NFT")
+
+        assert len(fake_queue.submits) == 3
+        assert fake_queue.submits[2]["additional_hotwords"] == ("DAO", "NFT")
+
+    def test_duplicates_within_batch_submitted_once(self, api_client, fake_queue):
+        """Test that identical files in one batch share a single transcription."""
+        audio = _create_wav_bytes(duration_seconds=1.0)
+
+        data = _post_batch(api_client, [audio, audio, _create_wav_bytes(duration_seconds=1.5)]).json()["data"]
+
+        assert data["successful_count"] == 3
+        assert len(fake_queue.submits) == 2
+        texts = [r["text"] for r in data["results"]]
+        assert texts[0] == texts[1] != texts[2]
+
+    def test_eviction_after_lookup_does_not_skip_validation(self, api_client, fake_queue, monkeypatch):
+        """Test that a batch cache hit is used as looked up, even if evicted before transcription."""
+        audio = _create_wav_bytes(duration_seconds=1.0)
+
+        class EvictingCache(TranscriptionCache):
+            """Cache whose entries are evicted right after any lookup."""
+
+            def get(self, key):
+                result = super().get(key)
+                self.clear()
+                return result
+
+            def __contains__(self, key):
+                result = super().__contains__(key)
+                self.clear()
+                return result
+
+        cache = EvictingCache()
+        cache.put(TranscriptionCache.make_key(hashlib.blake2b(audio).hexdigest(), "ja"), "cached", 0.9)
+        monkeypatch.setattr(routes, "transcription_cache", cache)
+
+        (result,) = _post_batch(api_client, [audio]).json()["data"]["results"]
+
+        assert result["cached"] is True
+        assert result["text"] == "cached"
+        assert fake_queue.submits == []
 
 
 class TestInputValidation:
     """Tests for input validation."""
 
-    def test_user_id_required(self):
-        """Test that user_id is required."""
-        request_data = {
-            "username": "test_user",
-            "start_ts": 1000,
-            "end_ts": 2000,
-        }
-        
-        assert "user_id" not in request_data
-
-    def test_timestamp_validation(self):
-        """Test timestamp validation."""
-        # end_ts should be greater than start_ts
-        valid = {
-            "start_ts": 1000,
-            "end_ts": 2000,
-        }
-        
-        invalid = {
-            "start_ts": 2000,
-            "end_ts": 1000,
-        }
-        
-        assert valid["end_ts"] > valid["start_ts"]
-        assert invalid["end_ts"] < invalid["start_ts"]
-
-    def test_language_default(self):
-        """Test language defaults to 'ja'."""
-        request_data = {
-            "user_id": "123",
-            "username": "test",
-            "start_ts": 1000,
-            "end_ts": 2000,
-            # language not provided
-        }
-        
-        # Language should default to 'ja' when not provided
-        language = request_data.get("language", "ja")
-        assert language == "ja"
+    @pytest.mark.parametrize("field", ["user_id", "username", "start_ts", "end_ts"])
+    def test_required_form_fields(self, api_client, fake_queue, field):
+        """Test that a missing required form field is rejected with 422."""
+        data = {k: v for k, v in _TRANSCRIBE_REQUEST.items() if k != field}
+        response = api_client.post(
+            "/transcribe",
+            files={"audio_file": ("audio.wav", _create_wav_bytes(duration_seconds=1.0), "audio/wav")},
+            data=data,
+        )
+
+        assert response.status_code == 422
+        assert fake_queue.submits == []
+
+    def test_invalid_metadata_entry(self, api_client, fake_queue):
+        """Test that a bad metadata entry fails only its own item."""
+        metadata = [{k: v for k, v in _BATCH_METADATA[0].items() if k != "user_id"}, _BATCH_METADATA[1]]
+        audio = [_create_wav_bytes(duration_seconds=1.0), _create_wav_bytes(duration_seconds=1.5)]
+        response = api_client.post(
+            "/transcribe/batch",
+            files=[("files", (f"audio{i}.wav", content, "audio/wav")) for i, content in enumerate(audio)],
+            data={"metadata": json.dumps(metadata)},
+        )
+
+        results = response.json()["data"]["results"]
+        assert results[0]["error"]["code"] == "INVALID_METADATA_ENTRY"
+        assert results[1]["success"] is True
+        assert len(fake_queue.submits) == 1
 
 
 class TestErrorResponses:
     """Tests for error responses."""
 
-    def test_error_response_structure(self):
-        """Test error response structure."""
-        error_response = {
-            "success": False,
-            "error": {
-                "code": "TRANSCRIPTION_FAILED",
-                "message": "Failed to transcribe audio",
-                "details": {"reason": "Audio too short"},
-            },
-        }
-        
-        assert error_response["success"] is False
-        assert "code" in error_response["error"]
-        assert "message" in error_response["error"]
-
-    def test_model_not_ready_error(self):
-        """Test model not ready error."""
-        error_response = {
-            "success": False,
-            "error": {
-                "code": "MODEL_NOT_READY",
-                "message": "Whisper model is not loaded",
-            },
+    def test_model_not_loaded(self, api_client, fake_queue, monkeypatch):
+        """Test that requests are refused while the model is loading."""
+        monkeypatch.setattr(routes, "whisper_service", FakeWhisperService(ready=False))
+        audio = _create_wav_bytes(duration_seconds=1.0)
+
+        single = _post_transcribe(api_client, audio).json()
+        batch = _post_batch(api_client, [audio]).json()
+
+        assert single["error"]["code"] == batch["error"]["code"] == "MODEL_NOT_LOADED"
+        assert fake_queue.submits == []
+        assert api_client.get("/health").json()["status"] == "loading"
+
+    def test_service_not_initialized(self, api_client, monkeypatch):
+        """Test that endpoints return 503 before init_router has run."""
+        monkeypatch.setattr(routes, "whisper_service", None)
+
+        assert api_client.get("/health").status_code == 503
+        assert _post_transcribe(api_client, _create_wav_bytes(duration_seconds=1.0)).status_code == 503
+
+    def test_transcription_failure(self, api_client, fake_queue, monkeypatch, tmp_path):
+        """Test that inference errors are reported as TRANSCRIPTION_FAILED and cleaned up."""
+        async def fail(audio_path, **options):
+            raise RuntimeError("CUDA out of memory")
+
+        monkeypatch.setattr(fake_queue, "submit", fail)
+
+        body = _post_transcribe(api_client, _create_wav_bytes(duration_seconds=1.0)).json()
+
+        assert body["success"] is False
+        assert body["error"] == {
+            "code": "TRANSCRIPTION_FAILED",
+            "message": "CUDA out of memory",
+            "details": None,
         }
-        
-        assert error_response["error"]["code"] == "MODEL_NOT_READY"
+        assert list(tmp_path.iterdir()) == []
 
 
 class TestAudioFileHandling:
     """Tests for audio file handling."""
 
     def test_wav_file_creation(self):
-        """Test WAV file can be created and read."""
+        """Test the WAV helper produces 16-bit mono 16kHz audio of the requested length."""
         audio_bytes = _create_wav_bytes(duration_seconds=2.0)
         
         # Verify it's a valid WAV file
@@ -318,9 +549,8 @@ class TestAudioFileHandling:
         buffer = BytesIO(audio_bytes)
         with wave.open(buffer, "rb") as wav:
             frames = wav.readframes(wav.getnframes())
-            # All zeros for silence
-            samples = struct.unpack(f"{len(frames)//2}h", frames)
-            assert all(s == 0 for s in samples)
+            # All zeros for silence (compared as one buffer)
+            assert frames == bytes(len(frames))
 
 
 # =============================================================================
@@ -357,30 +587,13 @@ class TestBatchIntegration:
     @pytest.mark.skip(reason="Requires Whisper model to be loaded")
     def test_batch_transcribe_multiple_files(self, client, sample_audio_bytes):
         """Test batch transcription of multiple files."""
-        metadata = [
-            {
-                "user_id": "123",
-                "username": "Alice",
-                "start_ts": 1000,
-                "end_ts": 2000,
-                "language": "ja",
-            },
-            {
-                "user_id": "456",
-                "username": "Bob",
-                "start_ts": 1500,
-                "end_ts": 2500,
-                "language": "ja",
-            },
-        ]
-
         response = client.post(
             "/transcribe/batch",
             files=[
                 ("files", ("audio1.wav", sample_audio_bytes, "audio/wav")),
                 ("files", ("audio2.wav", sample_audio_bytes, "audio/wav")),
             ],
-            data={"metadata": json.dumps(metadata)},
+            data={"metadata": _BATCH_METADATA_JSON},
         )
         assert response.status_code == 200
         data = response.json()
@@ -0,0 +1,61 @@
+"""
+Tests for TranscriptionCache.
+
+テスト項目:
+- キャッシュのヒット/ミス
+- LRU による追い出し
+- オプション違いの区別
+"""
+from src.services.transcription_cache import TranscriptionCache
+
+
+class TestTranscriptionCache:
+    """Tests for TranscriptionCache."""
+
+    def test_hit_and_miss(self):
+        """Test that stored results are returned and counted."""
+        cache = TranscriptionCache(max_entries=4)
+        key = TranscriptionCache.make_key("abc", "ja")
+
+        assert cache.get(key) is None
+        cache.put(key, "こんにちは", 0.9)
+
+        assert cache.get(key) == ("こんにちは", 0.9)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = TranscriptionCache(max_entries=2)
+        first = TranscriptionCache.make_key("1", "ja")
+        second = TranscriptionCache.make_key("2", "ja")
+        third = TranscriptionCache.make_key("3", "ja")
+
+        cache.put(first, "one", 0.9)
+        cache.put(second, "two", 0.9)
+        cache.get(first)
+        cache.put(third, "three", 0.9)
+
+        assert first in cache
+        assert second not in cache
+        assert third in cache
+        assert len(cache) == 2
+
+    def test_options_are_part_of_key(self):
+        """Test that language and hotwords produce distinct keys."""
+        base = TranscriptionCache.make_key("abc", "ja")
+
+        assert base != TranscriptionCache.make_key("abc", "en")
+        assert base != TranscriptionCache.make_key("abc", "ja", filter_aizuchi=False)
+        assert base != TranscriptionCache.make_key("abc", "ja", hotwords=["DAO"])
+        assert base == TranscriptionCache.make_key("abc", "ja", hotwords=[])
+
+    def test_disabled_cache(self):
+        """Test that a zero-sized cache stores nothing."""
+        cache = TranscriptionCache(max_entries=0)
+        key = TranscriptionCache.make_key("abc", "ja")
+
+        cache.put(key, "text", 0.9)
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
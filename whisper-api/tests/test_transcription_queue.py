@@ -0,0 +1,224 @@
+"""
+Tests for TranscriptionQueue.
+
+テスト項目:
+- 同時リクエストのバッチ化
+- エラーの個別伝播
+- 単発リクエストの優先処理
+- バッチ非対応サービスでは待ち時間なし・1件ずつ処理
+- ワーカー停止時のエラー通知
+- キャンセル時の一時ファイル保護
+"""
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from src.services.transcription_queue import (
+    TranscriptionQueue,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_BATCH,
+)
+from src.services.whisper import TranscriptionRequest
+
+
+class FakeWhisperService:
+    """Minimal stand-in recording how requests were batched."""
+
+    def __init__(self, supports_batching: bool = True):
+        self.supports_batching = supports_batching
+        self.batches: List[List[str]] = []
+
+    def transcribe_batch(self, requests: List[TranscriptionRequest]):
+        self.batches.append([r.audio_path for r in requests])
+        outcomes = []
+        for request in requests:
+            if request.audio_path == "bad.wav":
+                outcomes.append(RuntimeError("decode failed"))
+            else:
+                outcomes.append((f"text:{request.audio_path}", 0.9, 0.1))
+        return outcomes
+
+
+class BlockingWhisperService(FakeWhisperService):
+    """Service whose batches block in the worker thread until released."""
+
+    def __init__(self):
+        super().__init__(supports_batching=False)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def transcribe_batch(self, requests: List[TranscriptionRequest]):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return super().transcribe_batch(requests)
+
+
+async def _wait_for_event(event: threading.Event) -> None:
+    """Wait for a threading.Event without blocking the event loop."""
+    assert await asyncio.to_thread(event.wait, 5)
+
+
+@pytest.fixture
+def service() -> FakeWhisperService:
+    return FakeWhisperService()
+
+
+class TestTranscriptionQueue:
+    """Tests for TranscriptionQueue."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self, service):
+        """Test that concurrently submitted jobs share a batch."""
+        queue = TranscriptionQueue(service, max_batch_size=8, batch_window_ms=20)
+        worker = queue.start()
+        try:
+            results = await asyncio.gather(*(
+                queue.submit(f"{i}.wav") for i in range(3)
+            ))
+        finally:
+            worker.cancel()
+
+        assert [text for text, _, _ in results] == ["text:0.wav", "text:1.wav", "text:2.wav"]
+        assert service.batches == [["0.wav", "1.wav", "2.wav"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_capped(self, service):
+        """Test that batches never exceed max_batch_size."""
+        queue = TranscriptionQueue(service, max_batch_size=2, batch_window_ms=20)
+        worker = queue.start()
+        try:
+            await asyncio.gather(*(queue.submit(f"{i}.wav") for i in range(5)))
+        finally:
+            worker.cancel()
+
+        assert all(len(batch) <= 2 for batch in service.batches)
+        assert sum(len(batch) for batch in service.batches) == 5
+
+    @pytest.mark.asyncio
+    async def test_errors_are_raised_per_job(self, service):
+        """Test that a failing item does not fail the rest of its batch."""
+        queue = TranscriptionQueue(service, max_batch_size=8, batch_window_ms=20)
+        worker = queue.start()
+        try:
+            good, bad = await asyncio.gather(
+                queue.submit("good.wav"),
+                queue.submit("bad.wav"),
+                return_exceptions=True,
+            )
+        finally:
+            worker.cancel()
+
+        assert good[0] == "text:good.wav"
+        assert isinstance(bad, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_are_served_first(self, service):
+        """Test that single requests jump ahead of queued batch items."""
+        queue = TranscriptionQueue(service, max_batch_size=8, batch_window_ms=20)
+        worker = queue.start()  # Runs only after every submit below is queued
+        pending = [
+            asyncio.create_task(queue.submit(f"batch{i}.wav", priority=PRIORITY_BATCH))
+            for i in range(3)
+        ]
+        pending.append(asyncio.create_task(
+            queue.submit("single.wav", priority=PRIORITY_INTERACTIVE)
+        ))
+        try:
+            await asyncio.gather(*pending)
+        finally:
+            worker.cancel()
+
+        assert service.batches == [
+            ["single.wav"],
+            ["batch0.wav", "batch1.wav", "batch2.wav"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_window_without_batch_path(self):
+        """Test that a service without a batch path does not wait for the window."""
+        service = FakeWhisperService(supports_batching=False)
+        queue = TranscriptionQueue(service, max_batch_size=8, batch_window_ms=10_000)
+        worker = queue.start()
+        try:
+            text, _, _ = await asyncio.wait_for(queue.submit("single.wav"), timeout=1)
+        finally:
+            worker.cancel()
+
+        assert text == "text:single.wav"
+
+    @pytest.mark.asyncio
+    async def test_interactive_request_not_stuck_behind_local_batch(self):
+        """Test that without a batch path jobs run one at a time, letting single requests in between."""
+        service = FakeWhisperService(supports_batching=False)
+        queue = TranscriptionQueue(service, max_batch_size=8, batch_window_ms=20)
+        worker = queue.start()
+        pending = [
+            asyncio.create_task(queue.submit(f"batch{i}.wav", priority=PRIORITY_BATCH))
+            for i in range(3)
+        ]
+        try:
+            await pending[0]
+            pending.append(asyncio.create_task(
+                queue.submit("single.wav", priority=PRIORITY_INTERACTIVE)
+            ))
+            await asyncio.gather(*pending)
+        finally:
+            worker.cancel()
+
+        assert all(len(batch) == 1 for batch in service.batches)
+        order = [batch[0] for batch in service.batches]
+        assert order.index("single.wav") < order.index("batch2.wav")
+
+    @pytest.mark.asyncio
+    async def test_submit_without_worker(self, service):
+        """Test that submitting without a running worker fails instead of hanging."""
+        queue = TranscriptionQueue(service)
+
+        with pytest.raises(RuntimeError, match="not running"):
+            await queue.submit("single.wav")
+
+    @pytest.mark.asyncio
+    async def test_worker_stop_fails_pending_jobs(self):
+        """Test that queued and in-flight jobs fail when the worker stops."""
+        service = BlockingWhisperService()
+        queue = TranscriptionQueue(service)
+        worker = queue.start()
+        in_flight = asyncio.create_task(queue.submit("first.wav"))
+        queued = asyncio.create_task(queue.submit("second.wav"))
+        await _wait_for_event(service.started)
+
+        worker.cancel()
+        try:
+            for task in (in_flight, queued):
+                with pytest.raises(RuntimeError, match="worker stopped"):
+                    await asyncio.wait_for(task, timeout=1)
+        finally:
+            service.release.set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_waits_for_dispatched_job(self):
+        """Test that cancelling a dispatched job waits for the thread, and undispatched jobs are dropped."""
+        service = BlockingWhisperService()
+        queue = TranscriptionQueue(service)
+        worker = queue.start()
+        try:
+            in_flight = asyncio.create_task(queue.submit("first.wav"))
+            queued = asyncio.create_task(queue.submit("second.wav"))
+            await _wait_for_event(service.started)
+
+            in_flight.cancel()
+            queued.cancel()
+            await asyncio.sleep(0.05)
+            assert not in_flight.done()  # Still reading first.wav
+            assert queued.done()
+
+            service.release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await in_flight
+            await queue.submit("third.wav")
+        finally:
+            worker.cancel()
+
+        assert service.batches == [["first.wav"], ["third.wav"]]
@@ -9,87 +9,84 @@ T-3: Whisper推論テスト - WhisperService
 - 短い音声（500ms未満）の処理
 - 無音ファイルの処理
 - 統計情報の記録
+- クラウドプロバイダーのバッチ並列処理
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import wave
-import struct
-import math
+from unittest.mock import Mock, patch
 import tempfile
 import os
+from collections import namedtuple
+from types import SimpleNamespace
 
 from src.core.config import WhisperConfig
-from src.services.whisper import WhisperService, TranscriptionStats
+from src.services.hotwords import HotwordsManager
+from src.services.whisper import WhisperService, TranscriptionStats, TranscriptionRequest
 
 
-class TestTranscriptionStats:
-    """Tests for TranscriptionStats."""
-
-    def test_initial_values(self):
-        """Test initial statistics values."""
-        stats = TranscriptionStats()
-        assert stats.total_requests == 0
-        assert stats.successful_requests == 0
-        assert stats.failed_requests == 0
-        assert stats.avg_processing_time == 0.0
-
-    def test_record_success(self):
-        """Test recording successful transcription."""
-        stats = TranscriptionStats()
-        stats.record(processing_time=1.5, success=True, audio_duration_seconds=10.0)
+# Lightweight stand-ins for faster-whisper's Segment and TranscriptionInfo
+Segment = namedtuple("Segment", "text avg_logprob")
+Info = namedtuple("Info", "duration")
 
-        assert stats.total_requests == 1
-        assert stats.successful_requests == 1
-        assert stats.failed_requests == 0
-        assert stats.total_processing_time == 1.5
-        assert stats.total_audio_seconds == 10.0
 
-    def test_record_failure(self):
-        """Test recording failed transcription."""
-        stats = TranscriptionStats()
-        stats.record(processing_time=0.5, success=False)
+def _transcribe_result(*segments, duration: float = 1.0):
+    """Build a WhisperModel.transcribe return value from (text, avg_logprob) pairs."""
+    return iter([Segment(text, logprob) for text, logprob in segments]), Info(duration)
 
-        assert stats.total_requests == 1
-        assert stats.successful_requests == 0
-        assert stats.failed_requests == 1
 
-    def test_avg_processing_time(self):
-        """Test average processing time calculation."""
-        stats = TranscriptionStats()
-        stats.record(processing_time=1.0, success=True)
-        stats.record(processing_time=2.0, success=True)
-        stats.record(processing_time=3.0, success=True)
+@pytest.fixture(scope="module")
+def audio_path(tmp_path_factory) -> str:
+    """Path of an empty audio file, shared by tests whose model is mocked."""
+    path = tmp_path_factory.mktemp("audio") / "test.wav"
+    path.touch()
+    return str(path)
 
-        assert stats.avg_processing_time == 2.0
-
-    def test_success_rate(self):
-        """Test success rate calculation."""
-        stats = TranscriptionStats()
-        stats.record(processing_time=1.0, success=True)
-        stats.record(processing_time=1.0, success=True)
-        stats.record(processing_time=1.0, success=False)
 
-        assert stats.success_rate == pytest.approx(2 / 3)
+class TestTranscriptionStats:
+    """Tests for TranscriptionStats."""
 
-    def test_success_rate_no_requests(self):
-        """Test success rate when no requests made."""
+    @pytest.mark.parametrize("records,expected", [
+        pytest.param(
+            [],
+            dict(total_requests=0, successful_requests=0, failed_requests=0,
+                 avg_processing_time=0.0, success_rate=1.0),
+            id="initial_values",
+        ),
+        pytest.param(
+            [(1.5, True, 10.0)],
+            dict(total_requests=1, successful_requests=1, failed_requests=0,
+                 total_processing_time=1.5, total_audio_seconds=10.0),
+            id="record_success",
+        ),
+        pytest.param(
+            [(0.5, False)],
+            dict(total_requests=1, successful_requests=0, failed_requests=1),
+            id="record_failure",
+        ),
+        pytest.param(
+            [(1.0, True), (2.0, True), (3.0, True)],
+            dict(avg_processing_time=2.0),
+            id="avg_processing_time",
+        ),
+        pytest.param(
+            [(1.0, True), (1.0, True), (1.0, False)],
+            dict(success_rate=2 / 3),
+            id="success_rate",
+        ),
+        pytest.param(
+            [(0.5, True, 5.0), (1.0, True, 10.0), (0.3, False, 3.0), (0.8, True, 8.0)],
+            dict(total_requests=4, successful_requests=3, failed_requests=1,
+                 total_processing_time=2.6, total_audio_seconds=26.0),
+            id="multiple_recordings",
+        ),
+    ])
+    def test_record(self, records, expected):
+        """Test counters and derived values after a sequence of records."""
         stats = TranscriptionStats()
-        assert stats.success_rate == 1.0
+        for record in records:
+            stats.record(*record)
 
-    def test_multiple_recordings(self):
-        """Test multiple recordings with mixed results."""
-        stats = TranscriptionStats()
-        
-        stats.record(processing_time=0.5, success=True, audio_duration_seconds=5.0)
-        stats.record(processing_time=1.0, success=True, audio_duration_seconds=10.0)
-        stats.record(processing_time=0.3, success=False, audio_duration_seconds=3.0)
-        stats.record(processing_time=0.8, success=True, audio_duration_seconds=8.0)
-        
-        assert stats.total_requests == 4
-        assert stats.successful_requests == 3
-        assert stats.failed_requests == 1
-        assert stats.total_processing_time == pytest.approx(2.6)
-        assert stats.total_audio_seconds == 26.0
+        for field, value in expected.items():
+            assert getattr(stats, field) == pytest.approx(value), field
 
 
 class TestWhisperService:
@@ -155,6 +152,17 @@ class TestWhisperService:
         assert "success_rate" in stats
         assert "total_audio_processed_seconds" in stats
 
+    def test_get_status_stats_values(self):
+        """Test get_status averages agree with TranscriptionStats."""
+        service = WhisperService(WhisperConfig())
+        service.stats.record(processing_time=1.0, success=True)
+        service.stats.record(processing_time=2.0, success=False)
+
+        stats = service.get_status()["stats"]
+
+        assert stats["avg_processing_time_ms"] == pytest.approx(service.stats.avg_processing_time * 1000)
+        assert stats["success_rate"] == pytest.approx(service.stats.success_rate)
+
     def test_device_property(self):
         """Test device property."""
         config = WhisperConfig(device="cpu")
@@ -173,156 +181,105 @@ class TestWhisperService:
 class TestWhisperServiceTranscription:
     """T-3: Whisper推論テスト - 実際の文字起こし機能のテスト"""
 
-    @pytest.fixture
-    def mock_whisper_service(self):
-        """Create a mock whisper service for transcription tests."""
+    @pytest.fixture(scope="class")
+    def shared_whisper_service(self):
+        """Create one mock whisper service for the whole class."""
         config = WhisperConfig(model_name="tiny", device="cpu", compute_type="int8")
         service = WhisperService(config)
         
-        # Mock the model
-        mock_model = MagicMock()
+        # Mock the model; only transcribe is used, so a plain namespace avoids
+        # MagicMock's auto-created attributes
+        mock_model = SimpleNamespace(transcribe=Mock())
         service.model = mock_model
         
         return service, mock_model
 
-    def test_transcribe_clear_japanese(self, mock_whisper_service, temp_dir):
-        """Test transcription of clear Japanese audio."""
-        service, mock_model = mock_whisper_service
-        
-        # Mock segment with clear text
-        mock_segment = MagicMock()
-        mock_segment.text = " こんにちは、テストです。"
-        mock_segment.avg_logprob = -0.3
-        
-        mock_info = MagicMock()
-        mock_info.duration = 2.0
-        
-        mock_model.transcribe.return_value = (iter([mock_segment]), mock_info)
-        
-        filepath = os.path.join(temp_dir, "test_clear_japanese.wav")
-        _create_test_wav(filepath, duration_seconds=2.0)
-        
-        text, confidence, processing_time = service.transcribe(filepath, language="ja")
-        
-        assert "こんにちは" in text
-        assert confidence > 0.5
-        assert processing_time > 0
+    @pytest.fixture
+    def mock_whisper_service(self, shared_whisper_service):
+        """Reset the shared service so each test starts from a clean state."""
+        service, mock_model = shared_whisper_service
+        service.stats = TranscriptionStats()
+        mock_model.transcribe.reset_mock(return_value=True, side_effect=True)
+        return service, mock_model
 
-    def test_transcribe_noisy_audio(self, mock_whisper_service, temp_dir):
-        """Test transcription handles noisy audio gracefully."""
+    @pytest.mark.parametrize("segments,duration,expected_texts,confidence_range", [
+        # Clear Japanese audio
+        pytest.param([(" こんにちは、テストです。", -0.3)], 2.0, ["こんにちは"], (0.6, 1.0), id="clear_japanese"),
+        # Lower confidence (noisy audio)
+        pytest.param([(" よく聞こえませんでした", -1.5)], 3.0, ["よく聞こえませんでした"], (0.0, 1.0), id="noisy_audio"),
+        # Empty result for very short audio (under 500ms)
+        pytest.param([], 0.3, [], (0.0, 0.0), id="short_audio"),
+        # Empty result for silence
+        pytest.param([], 1.0, [], (0.0, 0.0), id="silence"),
+        pytest.param([(" テスト", -0.5)], 1.0, ["テスト"], (0.0, 1.0), id="single_word"),
+        pytest.param(
+            [(" こんにちは", -0.3), (" テストです", -0.4), (" よろしく", -0.5)],
+            5.0,
+            ["こんにちは", "テストです", "よろしく"],
+            (0.0, 1.0),
+            id="multiple_segments",
+        ),
+    ])
+    def test_transcribe(
+        self, mock_whisper_service, audio_path, segments, duration, expected_texts, confidence_range,
+    ):
+        """Test text, confidence and recorded stats for mocked model output."""
         service, mock_model = mock_whisper_service
+        mock_model.transcribe.return_value = _transcribe_result(*segments, duration=duration)
+        assert service.stats.total_requests == 0
         
-        # Mock segment with lower confidence (noisy audio)
-        mock_segment = MagicMock()
-        mock_segment.text = " よく聞こえませんでした"
-        mock_segment.avg_logprob = -1.5  # Lower confidence
-        
-        mock_info = MagicMock()
-        mock_info.duration = 3.0
-        
-        mock_model.transcribe.return_value = (iter([mock_segment]), mock_info)
-        
-        filepath = os.path.join(temp_dir, "test_noisy.wav")
-        _create_test_wav(filepath, duration_seconds=3.0, add_noise=True)
-        
-        text, confidence, processing_time = service.transcribe(filepath, language="ja")
+        text, confidence, processing_time = service.transcribe(audio_path, language="ja")
         
-        assert isinstance(text, str)
-        assert 0.0 <= confidence <= 1.0
+        for expected in expected_texts:
+            assert expected in text
+        if not expected_texts:
+            assert text == ""
+        low, high = confidence_range
+        assert low <= confidence <= high
         assert processing_time > 0
-
-    def test_transcribe_short_audio(self, mock_whisper_service, temp_dir):
-        """Test transcription of short audio (under 500ms)."""
-        service, mock_model = mock_whisper_service
-        
-        # Mock empty result for very short audio
-        mock_info = MagicMock()
-        mock_info.duration = 0.3
-        
-        mock_model.transcribe.return_value = (iter([]), mock_info)
         
-        filepath = os.path.join(temp_dir, "test_short.wav")
-        _create_test_wav(filepath, duration_seconds=0.3)
-        
-        text, confidence, processing_time = service.transcribe(filepath, language="ja")
-        
-        assert text == ""
-        assert confidence == 0.0
+        # Stats are recorded; a transcription with text counts as a success
+        assert service.stats.total_requests == 1
+        assert service.stats.successful_requests == (1 if expected_texts else 0)
 
-    def test_transcribe_silence(self, mock_whisper_service, temp_dir):
-        """Test transcription of silence."""
+    def test_initial_prompt_includes_hotwords(self, mock_whisper_service, audio_path, monkeypatch):
+        """Test that the Japanese prompt lists server and request hotwords."""
         service, mock_model = mock_whisper_service
-        
-        # Mock empty result for silence
-        mock_info = MagicMock()
-        mock_info.duration = 1.0
-        
-        mock_model.transcribe.return_value = (iter([]), mock_info)
-        
-        filepath = os.path.join(temp_dir, "test_silence.wav")
-        _create_test_wav(filepath, duration_seconds=1.0, silence=True)
-        
-        text, confidence, processing_time = service.transcribe(filepath, language="ja")
-        
-        assert text == "" or len(text.strip()) == 0
+        monkeypatch.setattr(service, "hotwords", HotwordsManager(hotwords=["DAO"]))
+        mock_model.transcribe.return_value = _transcribe_result()
 
-    def test_transcribe_records_stats(self, mock_whisper_service, temp_dir):
-        """Test that transcription records statistics."""
-        service, mock_model = mock_whisper_service
-        
-        mock_segment = MagicMock()
-        mock_segment.text = " テスト"
-        mock_segment.avg_logprob = -0.5
-        
-        mock_info = MagicMock()
-        mock_info.duration = 1.0
-        
-        mock_model.transcribe.return_value = (iter([mock_segment]), mock_info)
-        
-        filepath = os.path.join(temp_dir, "test_stats.wav")
-        _create_test_wav(filepath, duration_seconds=1.0)
-        
-        # Initial stats
-        assert service.stats.total_requests == 0
-        
-        # Transcribe
-        service.transcribe(filepath, language="ja")
-        
-        # Check stats updated
-        assert service.stats.total_requests == 1
-        assert service.stats.successful_requests == 1
+        service.transcribe(audio_path, language="ja", additional_hotwords=["NFT"])
+        assert mock_model.transcribe.call_args.kwargs["initial_prompt"] == (
+            "これは日本語の会話です。Discordのボイスチャンネルで話しています。 用語: DAO, NFT"
+        )
+
+        mock_model.transcribe.return_value = _transcribe_result()
+        service.transcribe(audio_path, language="en")
+        assert mock_model.transcribe.call_args.kwargs["initial_prompt"] == "DAO"
 
-    def test_transcribe_multiple_segments(self, mock_whisper_service, temp_dir):
-        """Test transcription with multiple segments."""
+    def test_filters_skipped_when_disabled(self, mock_whisper_service, audio_path, monkeypatch):
+        """Test that disabled filters are not consulted and enabled ones apply."""
         service, mock_model = mock_whisper_service
-        
-        mock_segments = []
-        for i, text in enumerate(["こんにちは", "テストです", "よろしく"]):
-            seg = MagicMock()
-            seg.text = f" {text}"
-            seg.avg_logprob = -0.3 - (i * 0.1)
-            mock_segments.append(seg)
-        
-        mock_info = MagicMock()
-        mock_info.duration = 5.0
-        
-        mock_model.transcribe.return_value = (iter(mock_segments), mock_info)
-        
-        filepath = os.path.join(temp_dir, "test_multiple_segments.wav")
-        _create_test_wav(filepath, duration_seconds=5.0)
-        
-        text, confidence, processing_time = service.transcribe(filepath, language="ja")
-        
-        assert "こんにちは" in text
-        assert "テストです" in text
-        assert "よろしく" in text
+        segments = [(" はい", -0.3), (" 次の議題です", -0.3)]
+
+        with monkeypatch.context() as m:
+            m.setattr(service.aizuchi_filter, "is_aizuchi_norm", Mock(side_effect=AssertionError))
+            m.setattr(service.hallucination_filter, "filter", Mock(side_effect=AssertionError))
+            mock_model.transcribe.return_value = _transcribe_result(*segments)
+            text, _, _ = service.transcribe(audio_path, language="ja")
+            assert text == "はい 次の議題です"
+
+        monkeypatch.setattr(service.aizuchi_filter, "enabled", True)
+        mock_model.transcribe.return_value = _transcribe_result(*segments)
+        text, _, _ = service.transcribe(audio_path, language="ja")
+        assert text == "次の議題です"
 
 
 class TestWhisperServiceEdgeCases:
     """Edge case tests for WhisperService."""
 
     @patch("faster_whisper.WhisperModel")
-    def test_transcribe_exception_handling(self, mock_whisper_model, temp_dir):
+    def test_transcribe_exception_handling(self, mock_whisper_model, audio_path):
         """Test that exceptions are handled and stats recorded."""
         config = WhisperConfig(model_name="tiny", device="cpu", compute_type="int8")
         service = WhisperService(config)
@@ -332,50 +289,45 @@ class TestWhisperServiceEdgeCases:
         mock_whisper_model.return_value.transcribe.side_effect = Exception("Test error")
         service.model = mock_whisper_model.return_value
         
-        filepath = os.path.join(temp_dir, "test_exception.wav")
-        _create_test_wav(filepath, duration_seconds=1.0)
-        
         with pytest.raises(Exception, match="Test error"):
-            service.transcribe(filepath)
+            service.transcribe(audio_path)
         
         # Check failure was recorded
         assert service.stats.failed_requests == 1
 
 
-def _create_test_wav(
-    filepath: str,
-    duration_seconds: float = 1.0,
-    sample_rate: int = 16000,
-    silence: bool = False,
-    add_noise: bool = False
-) -> None:
-    """Create a test WAV file.
-    
-    Args:
-        filepath: Path to write the WAV file
-        duration_seconds: Duration in seconds
-        sample_rate: Sample rate in Hz
-        silence: If True, create silence (all zeros)
-        add_noise: If True, add random noise
-    """
-    num_samples = int(sample_rate * duration_seconds)
-    
-    with wave.open(filepath, "w") as wav_file:
-        wav_file.setnchannels(1)  # Mono
-        wav_file.setsampwidth(2)  # 16-bit
-        wav_file.setframerate(sample_rate)
-        
-        for i in range(num_samples):
-            if silence:
-                value = 0
-            elif add_noise:
-                # 440Hz tone with noise
-                import random
-                tone = int(5000 * math.sin(2 * math.pi * 440 * i / sample_rate))
-                noise = random.randint(-3000, 3000)
-                value = max(-32768, min(32767, tone + noise))
-            else:
-                # Pure 440Hz tone
-                value = int(10000 * math.sin(2 * math.pi * 440 * i / sample_rate))
-            
-            wav_file.writeframes(struct.pack("h", value))
+class TestWhisperServiceCloudBatch:
+    """Tests for batched cloud transcription."""
+
+    @patch("src.services.whisper.create_provider")
+    def test_cloud_batch_runs_concurrently(self, mock_create_provider):
+        """Test that cloud requests in a batch are in flight at the same time."""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def transcribe(audio_path, language):
+            if audio_path == "bad.ogg":
+                raise RuntimeError("API error")
+            barrier.wait()  # Fails unless all three calls overlap
+            return f"text:{audio_path}", 0.9, 0.1
+
+        provider = Mock()
+        provider.is_ready.return_value = True
+        provider.transcribe.side_effect = transcribe
+        mock_create_provider.return_value = provider
+
+        service = WhisperService(WhisperConfig(provider="groq", groq_api_key="key"))
+        service.load_model()
+        service.hallucination_filter.filter = Mock(side_effect=AssertionError)  # disabled
+
+        outcomes = service.transcribe_batch([
+            TranscriptionRequest(audio_path=path)
+            for path in ("a.ogg", "bad.ogg", "b.ogg", "c.ogg")
+        ])
+
+        assert outcomes[0] == ("text:a.ogg", 0.9, 0.1)
+        assert isinstance(outcomes[1], RuntimeError)
+        assert [o[0] for o in outcomes[2:]] == ["text:b.ogg", "text:c.ogg"]
+        assert service.stats.total_requests == 4
+        assert service.stats.failed_requests == 1